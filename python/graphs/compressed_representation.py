@@ -0,0 +1,205 @@
+"""
+Compressed Adjacency ( Gap + Varint Encoding )
+==============================================
+
+> _store the distance to the next neighbour , not the neighbour_
+
+- a CSR spends 8 bytes on every edge , no matter how small the graph is
+- but a sorted neighbour list `[1000, 1003, 1004, 1010]` can be stored as gaps `[1000, 3, 1, 6]`
+    - and small numbers don't need 8 bytes
+- varint ( LEB128 ) encoding : 7 bits of the number per byte , the 8th bit says "more bytes follow"
+    - `0 .. 127` => 1 byte , `128 .. 16383` => 2 bytes ... and so on
+
+Layout :
+
+- `data`            : all encoded neighbour lists back to back ( `bytes` )
+- `offsets[node]`   : byte position in `data` where the list of `node` starts ( `len(offsets) == node_count + 1` )
+- `degrees[node]`   : number of neighbours of `node` ( so `len(graph[node])` needs no decoding )
+- first neighbour is stored relative to the node itself ( zig-zag encoded , as it can be negative )
+    - so the closer neighbour ids sit to each other ( and to the node ) , the smaller the gaps
+    - relabeling ( see `reordering` ) only helps if it shrinks those gaps , it's not a given :
+        in the benchmark below , reverse cuthill-mckee spreads the near neighbours out and compresses *worse*
+
+KeyPoints :
+
+- neighbours are decoded on the fly while iterating , nothing is expanded in memory
+    - `graph[node]` is a light view , it can be iterated any number of times and has a `len`
+- neighbour lists come out sorted
+- read-only , un-weighted
+
+python3 -m compressed_representation
+"""
+from typing import *
+from array import array
+
+from graph_representation import AdjacencyView, CSR, Types
+
+
+def _append_varint(buffer: bytearray, value: int) -> None:
+    """LEB128 encoding of a non-negative integer"""
+    while value >= 0x80:
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+class _Neighbours:
+    """neighbours of one node , decoded on every iteration"""
+    __slots__ = ('_graph', '_node')
+
+    def __init__(self, graph: 'CompressedCSR', node: Types.Node):
+        self._graph = graph
+        self._node = node
+
+    def __iter__(self) -> Iterator[Types.Node]:
+        offsets: array = self._graph.offsets
+        return self._graph._decode(self._node, offsets[self._node], offsets[self._node + 1])
+
+    def __len__(self) -> int:
+        return self._graph.degrees[self._node]
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
+class CompressedCSR:
+    """
+    Gap + Varint Encoded Adjacency
+    ==============================
+    - follows the neighbour access protocol ( see `AdjacencyView` )
+
+    NOTE:
+        - nodes must be named `0 .. n-1`
+    """
+    def __init__(self, offsets: array, degrees: array, data: bytes):
+        self._offsets = offsets
+        self._degrees = degrees
+        self._data = data
+
+    @classmethod
+    def from_adjacency(cls, graph: AdjacencyView[Types.Node]) -> 'CompressedCSR':
+        node_count: int = len(graph)
+        offsets: array = array('q', [0])
+        degrees: array = array('I')
+        data: bytearray = bytearray()
+        for node in range(node_count):
+            previous: Optional[int] = None
+            neighbours: List[Types.Node] = sorted(graph[node])
+            degrees.append(len(neighbours))
+            for neighbour in neighbours:
+                if previous is None:
+                    gap: int = neighbour - node
+                    _append_varint(data, (gap << 1) if gap >= 0 else ((-gap << 1) - 1))   # zig-zag
+                else:
+                    _append_varint(data, neighbour - previous)
+                previous = neighbour
+            offsets.append(len(data))
+        return cls(offsets, degrees, bytes(data))
+
+    @property
+    def offsets(self) -> array:
+        return self._offsets
+
+    @property
+    def degrees(self) -> array:
+        return self._degrees
+
+    @property
+    def data(self) -> bytes:
+        return self._data
+
+    @property
+    def nbytes(self) -> int:
+        """memory held by the arrays ( in bytes )"""
+        return len(self._data) + len(self._offsets) * self._offsets.itemsize + len(self._degrees) * self._degrees.itemsize
+
+    def _decode(self, node: Types.Node, position: int, end: int) -> Iterator[Types.Node]:
+        data: bytes = self._data
+        neighbour: Optional[int] = None
+        while position < end:
+            # - read a varint
+            value, shift = 0, 0
+            while True:
+                byte: int = data[position]
+                position += 1
+                value |= (byte & 0x7F) << shift
+                if byte < 0x80:
+                    break
+                shift += 7
+            # - undo the gaps
+            if neighbour is None:
+                neighbour = node + ((value >> 1) ^ -(value & 1))   # zig-zag
+            else:
+                neighbour += value
+            yield neighbour
+
+    # Neighbour Access Protocol ( see `AdjacencyView` )
+
+    def __getitem__(self, node: Types.Node) -> _Neighbours:
+        if not 0 <= node < len(self._offsets) - 1:
+            raise KeyError(node)
+        return _Neighbours(self, node)
+
+    def __iter__(self) -> Iterator[Types.Node]:
+        return iter(range(len(self._offsets) - 1))
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __contains__(self, node: Types.Node) -> bool:
+        return isinstance(node, int) and 0 <= node < len(self._offsets) - 1
+
+
+def csr_nbytes(csr: CSR) -> int:
+    """memory held by the arrays of a plain CSR ( in bytes )"""
+    return len(csr.offsets) * csr.offsets.itemsize + len(csr.targets) * csr.targets.itemsize
+
+
+# Testing Entrypoint
+# ------------------
+if __name__ == '__main__':
+    import random
+    import time
+    from traversal.bfs import bfs
+    from reordering import relabel, reverse_cuthill_mckee, bfs_order, degree_order
+
+    # - round trip
+    graph: Dict[Types.Node, Set[Types.Node]] = {0: {1, 2}, 1: {2, 3}, 2: {4}, 3: {2, 4}, 4: {0, 300}}
+    graph.update({node: set() for node in range(5, 301)})
+    compressed: CompressedCSR = CompressedCSR.from_adjacency(graph)
+    assert all(list(compressed[node]) == sorted(graph[node]) and len(compressed[node]) == len(graph[node]) for node in graph)
+    assert bfs(compressed, 0) == bfs(graph, 0)
+    # - neighbours can be read more than once
+    neighbours = compressed[3]
+    assert list(neighbours) == list(neighbours) == [2, 4]
+    assert degree_order(compressed) == degree_order(CSR.from_adjacency(graph))
+
+    # - a sparse graph with some locality ( 8 near neighbours + 2 random ones per node ) ,
+    #   before & after relabeling with reverse cuthill-mckee
+    rng: random.Random = random.Random(11)
+    node_count: int = 100_000
+    local_graph: Dict[int, Set[int]] = {
+        node: {(node + rng.randint(1, 16)) % node_count for _ in range(8)} | {rng.randrange(node_count) for _ in range(2)}
+        for node in range(node_count)
+    }
+    local_csr: CSR = CSR.from_adjacency(local_graph)
+    rcm_csr, _ = relabel(local_csr, reverse_cuthill_mckee(local_csr))
+
+    def edges_per_second(graph: AdjacencyView[Types.Node], edge_count: int) -> float:
+        """throughput of a full BFS ( every edge is read once )"""
+        started: float = time.perf_counter()
+        bfs_order(graph)
+        return edge_count / (time.perf_counter() - started)
+
+    print(f"\n{'Compressed Adjacency vs CSR':^90}")
+    print("+", "-" * 86, "+")
+    print(f"| {'graph':<22} | {'csr bytes/edge':>14} | {'varint bytes/edge':>17} | {'csr edges/s':>11} | {'varint edges/s':>14} |")
+    print("+", "-" * 86, "+")
+    for name, csr in (('local + random edges', local_csr), ('same , rcm relabeled', rcm_csr)):
+        compressed = CompressedCSR.from_adjacency(csr)
+        assert all(list(compressed[node]) == sorted(csr[node]) for node in csr)
+        print(
+            f"| {name:<22} | {csr_nbytes(csr) / csr.edge_count:>14.2f} | {compressed.nbytes / csr.edge_count:>17.2f} "
+            f"| {edges_per_second(csr, csr.edge_count):>11,.0f} | {edges_per_second(compressed, csr.edge_count):>14,.0f} |"
+        )
+    print("+", "-" * 86, "+")
@@ -0,0 +1,182 @@
+"""
+Connected Components ( via Union-Find )
+
+- two nodes are in the same component , if there is a path between them ( edges taken un-directed )
+- a BFS / DFS from every unvisited node finds them too , but needs the whole graph up front
+- union-find only needs the edges , one at a time , in any order
+    - every edge `u -- v` merges the sets of `u` & `v` ( `ds.DisjointSet` )
+    - at the end , nodes with the same representative are in the same component
+- with path compression & union by rank , that's near linear : `O((V + E) * α(V))`
+
+KeyPoints :
+
+- labels are renumbered `0 .. k-1` , in order of the smallest node of each component
+- `label_propagation` does the same over numpy edge arrays , a whole edge array per step
+    - every node takes the smallest label among it's neighbours , then labels jump to their label's label
+    - repeats until nothing changes , so it's `O(E)` per step , and a few steps on low diameter graphs
+
+python3 -m connected_components.union_find
+"""
+from typing import *
+import numpy as np
+
+from ds import DisjointSet
+from graph_representation import AdjacencyView, Types
+
+Node = Types.Node
+Edge = Tuple[Node, Node]
+
+
+class ConnectedComponents:
+    """
+    Connected Components
+    [Thread Un-Safe]
+
+    - `labels[node]` : component of `node` , `0 .. count-1`
+    - edges can keep coming in after construction ( `add_edge` ) , labels are recomputed lazily
+    """
+    def __init__(self, node_count: int = 0, edges: Iterable[Edge] = ()):
+        """constructor"""
+        self._sets: DisjointSet = DisjointSet(node_count)
+        self._labels: Optional[List[int]] = None
+        for u, v in edges:
+            self.add_edge(u, v)
+
+    @classmethod
+    def from_graph(cls, graph: AdjacencyView) -> 'ConnectedComponents':
+        """
+        components of a graph following the neighbour access protocol ( dict / `Graph` / `CSR` / ... )
+
+        - Note
+            - nodes must be named `0 .. n-1`
+            - weighted neighbours `( node, weight )` are taken as is , wrap the graph in `UnweightedView` first
+        """
+        components: ConnectedComponents = cls(len(graph))
+        union = components._sets.union
+        for node in graph:
+            for neighbour in graph[node]:
+                union(node, neighbour)
+        return components
+
+    def add_node(self, node: Node) -> None:
+        """makes sure `node` ( and every node below it ) exists"""
+        if node >= len(self._sets):
+            self._sets.grow(node + 1)
+            self._labels = None
+
+    def add_edge(self, u: Node, v: Node) -> bool:
+        """adds `u -- v` , `True` if it merged two components"""
+        self.add_node(max(u, v))
+        merged: bool = self._sets.union(u, v)
+        if merged:
+            self._labels = None
+        return merged
+
+    def same_component(self, u: Node, v: Node) -> bool:
+        """checks if there is a path between `u` & `v`"""
+        return self._sets.connected(u, v)
+
+    @property
+    def count(self) -> int:
+        """number of components"""
+        return self._sets.count
+
+    @property
+    def labels(self) -> List[int]:
+        """component of every node , `0 .. count-1`"""
+        if self._labels is None:
+            find = self._sets.find
+            label_of_root: Dict[Node, int] = {}
+            self._labels = [label_of_root.setdefault(find(node), len(label_of_root)) for node in range(len(self._sets))]
+        return self._labels
+
+    def components(self) -> List[List[Node]]:
+        """nodes of every component , by label"""
+        groups: List[List[Node]] = [[] for _ in range(self.count)]
+        for node, label in enumerate(self.labels):
+            groups[label].append(node)
+        return groups
+
+
+def label(graph: AdjacencyView) -> List[int]:
+    """component label of every node of `graph` , `0 .. k-1`"""
+    return ConnectedComponents.from_graph(graph).labels
+
+
+def label_edges(node_count: int, edges: Iterable[Edge]) -> List[int]:
+    """component label of every node `0 .. node_count-1` , from a stream of edges"""
+    return ConnectedComponents(node_count, edges).labels
+
+
+def label_propagation(node_count: int, sources: np.ndarray, targets: np.ndarray) -> np.ndarray:
+    """
+    component label of every node ( vectorized ) , same labels as `label_edges`
+
+    - `sources[i] -- targets[i]` is the `i`-th edge
+    """
+    sources = np.asarray(sources, dtype=np.int64)
+    targets = np.asarray(targets, dtype=np.int64)
+    labels: np.ndarray = np.arange(node_count, dtype=np.int64)
+    while True:
+        previous: np.ndarray = labels.copy()
+        # - smallest label among the neighbours , both ways
+        np.minimum.at(labels, sources, labels[targets])
+        np.minimum.at(labels, targets, labels[sources])
+        # - shortcut , `labels[node]` is a node of the same component with a label no larger
+        while True:
+            jumped: np.ndarray = labels[labels]
+            if np.array_equal(jumped, labels):
+                break
+            labels = jumped
+        if np.array_equal(labels, previous):
+            break
+    # - every label is now the smallest node of it's component , renumber them `0 .. k-1`
+    roots: np.ndarray = labels == np.arange(node_count)
+    return (np.cumsum(roots) - 1)[labels]
+
+
+# Testing Entrypoint
+# ------------------
+if __name__ == '__main__':
+    import time
+    from graph_representation import Graph
+    from generators import random_csr
+
+    edges: List[Edge] = [(0, 1), (2, 3), (4, 2), (6, 5)]
+    assert label_edges(8, edges) == [0, 0, 1, 1, 1, 2, 2, 3]
+    assert label_propagation(8, *np.array(edges).T).tolist() == [0, 0, 1, 1, 1, 2, 2, 3]
+
+    components = ConnectedComponents(8, edges)
+    assert components.count == 4
+    assert components.same_component(3, 4) == True and components.same_component(0, 7) == False
+    assert components.add_edge(7, 1) == True and components.add_edge(0, 7) == False
+    assert components.components() == [[0, 1, 7], [2, 3, 4], [5, 6]]
+    assert components.add_edge(9, 8) == True and components.labels[8:] == [3, 3]
+
+    graph: Graph = Graph()
+    for node in range(5):
+        graph.add_node(node)
+    for edge in ((0, 1), (3, 4)):
+        graph.add_edge(edge)
+    assert label(graph) == [0, 0, 1, 2, 2]
+    assert label({0: {1}, 1: set(), 2: set()}) == [0, 0, 1]
+
+    # Benchmark
+    # - a sparse random graph , around the giant component threshold ( many components )
+    print(f"\n{'Connected Components':^69}")
+    print("+", "-" * 65, "+")
+    print(f"| {'nodes':>10} | {'edges':>10} | {'components':>10} | {'union-find (s)':>14} | {'numpy (s)':>9} |")
+    print("+", "-" * 65, "+")
+    for node_count in (100_000, 1_000_000):
+        csr = random_csr(node_count, 1, seed=7)
+        started: float = time.perf_counter()
+        expected: List[int] = label(csr)
+        union_find_seconds: float = time.perf_counter() - started
+        offsets: np.ndarray = np.frombuffer(csr.offsets, dtype=np.int64)
+        sources: np.ndarray = np.repeat(np.arange(node_count), np.diff(offsets))
+        started = time.perf_counter()
+        result: np.ndarray = label_propagation(node_count, sources, np.frombuffer(csr.targets, dtype=np.int64))
+        numpy_seconds: float = time.perf_counter() - started
+        assert result.tolist() == expected
+        print(f"| {node_count:>10,} | {csr.edge_count:>10,} | {max(expected) + 1:>10,} | {union_find_seconds:>14.2f} | {numpy_seconds:>9.2f} |")
+    print("+", "-" * 65, "+")
@@ -0,0 +1,182 @@
+"""
+Elementary Cycles ( in Directed Graph , using Johnson's Algorithm )
+===================================================================
+
+- the detectors stop at the first cycle , for diagnostics we want to list them
+- an *elementary* cycle visits no node twice , there can be exponentially many , so they are generated lazily
+    and the generator can be bounded by count , length and time
+
+Johnson's Algorithm :
+
+- a cycle never leaves it's strongly connected component ( SCC ) , so every SCC is searched on it's own
+    - SCCs come from `strongly_connected_components.tarjan` , there is no separate copy here
+- inside an SCC , pick a `start` node , list the cycles through it , then drop it and split the rest into SCCs again ( same Tarjan )
+- listing the cycles through `start` is a backtracking DFS , made output sensitive by **blocking** :
+    - a node is blocked while it's on the path , and stays blocked after it if it could not lead back to `start`
+    - `B[w]` : nodes to unblock as soon as `w` gets unblocked ( they were stuck only because of `w` )
+    - => `O((V + E) * (C + 1))` for `C` cycles , i.e never a long search between two cycles
+
+- self loops are cycles of length 1 , listed first
+
+    - Note
+        - a cycle is returned as `[v0, v1, ..., vk]` : edges `v0 --> v1 --> ... --> vk --> v0`
+        - with `max_length` , a path cut short marks it's nodes as if they closed a cycle ( so they get unblocked ) ,
+            blocking is weaker then , but no short cycle is missed
+
+python3 -m cycle_detection.elementary_cycles
+"""
+from typing import *
+from collections import defaultdict
+import time
+
+from graph_representation import AdjacencyView
+from strongly_connected_components.tarjan import strongly_connected_components
+
+# Custom Types
+
+# - a node ( vertex ) type
+Node = NewType('Node', int)
+# - a graph type
+#       - any representation following the neighbour access protocol ( dict / `Graph` / `CSR` )
+Graph = AdjacencyView[Node] # Adjacency List
+
+# ---
+
+def _unblock(node: Node, blocked: Set[Node], B: Dict[Node, Set[Node]]) -> None:
+    stack: List[Node] = [node]
+    while stack:
+        node = stack.pop()
+        if node in blocked:
+            blocked.discard(node)
+            stack.extend(B[node])
+            B[node].clear()
+
+def elementary_cycles(
+    graph: Graph,
+    max_cycles: Optional[int] = None,
+    max_length: Optional[int] = None,
+    time_limit: Optional[float] = None,
+) -> Iterator[List[Node]]:
+    """
+    yields the elementary cycles of `graph` , one at a time
+
+    - `max_cycles` : stop after this many cycles
+    - `max_length` : only cycles of at most this many nodes
+    - `time_limit` : stop after this many seconds ( checked between steps , not while the caller holds a cycle )
+    """
+    deadline: float = time.perf_counter() + time_limit if time_limit is not None else float('inf')
+    found: int = 0
+
+    def exhausted() -> bool:
+        return (max_cycles is not None and found >= max_cycles) or time.perf_counter() > deadline
+
+    # - own copy , nodes get removed as we go
+    subgraph: Dict[Node, Set[Node]] = {node: set(graph[node]) for node in graph}
+    for node in subgraph:
+        if node in subgraph[node]:
+            if exhausted():
+                return
+            found += 1
+            yield [node]
+            subgraph[node].discard(node)
+
+    components: List[Set[Node]] = [set(component) for component in strongly_connected_components(subgraph) if len(component) > 1]
+    while components:
+        component: Set[Node] = components.pop()
+        scc: Dict[Node, Set[Node]] = {node: subgraph[node] & component for node in component}
+        start: Node = next(iter(scc))
+        path: List[Node] = [start]
+        blocked: Set[Node] = {start}
+        closed: Set[Node] = set()
+        B: Dict[Node, Set[Node]] = defaultdict(set)
+        stack: List[Tuple[Node, List[Node]]] = [(start, list(scc[start]))]
+        while stack:
+            if exhausted():
+                return
+            node, neighbours = stack[-1]
+            if neighbours:
+                neighbour: Node = neighbours.pop()
+                if neighbour == start:
+                    found += 1
+                    yield path[:]
+                    closed.update(path)
+                elif neighbour not in blocked:
+                    if max_length is not None and len(path) >= max_length:
+                        closed.update(path) # cut short , so it doesn't count as a dead end
+                    else:
+                        path.append(neighbour)
+                        stack.append((neighbour, list(scc[neighbour])))
+                        closed.discard(neighbour)
+                        blocked.add(neighbour)
+                        continue
+            if not neighbours:
+                if node in closed:
+                    _unblock(node, blocked, B)
+                else:
+                    for neighbour in scc[node]:
+                        B[neighbour].add(node)
+                stack.pop()
+                path.pop()
+
+        # - done with `start` , split what's left of the component
+        del scc[start]
+        for node in scc:
+            scc[node].discard(start)
+        components.extend(set(rest) for rest in strongly_connected_components(scc) if len(rest) > 1)
+
+# Testing Entrypoint
+# ------------------
+if __name__ == "__main__":
+    from itertools import permutations
+
+    def canonical(cycle: List[Node]) -> Tuple[Node, ...]:
+        """rotation starting at the smallest node"""
+        first: int = cycle.index(min(cycle))
+        return tuple(cycle[first:] + cycle[:first])
+
+    def is_cycle(cycle: List[Node], graph: Graph) -> bool:
+        return len(set(cycle)) == len(cycle) and all(cycle[(index + 1) % len(cycle)] in graph[node] for index, node in enumerate(cycle))
+
+    # - complete digraph on 4 nodes : 6 two-cycles + 8 three-cycles + 6 four-cycles
+    complete: Graph = {node: {other for other in range(4) if other != node} for node in range(4)}
+    cycles: List[List[Node]] = list(elementary_cycles(complete))
+    assert len(cycles) == 20 and len(set(map(canonical, cycles))) == 20 and all(is_cycle(cycle, complete) for cycle in cycles)
+    assert len(list(elementary_cycles(complete, max_length=2))) == 6
+    assert len(list(elementary_cycles(complete, max_length=3))) == 14
+    assert len(list(elementary_cycles(complete, max_cycles=5))) == 5
+
+    # - self loop , and a DAG
+    assert sorted(map(canonical, elementary_cycles({0: {0, 1}, 1: {0}}))) == [(0,), (0, 1)]
+    assert list(elementary_cycles({0: {1, 2}, 1: {2}, 2: set()})) == []
+
+    # - against brute force ( every ordered node subset ) , on a small random graph
+    import random
+    rng: random.Random = random.Random(49)
+    small: Dict[Node, Set[Node]] = {node: {other for other in range(7) if other != node and rng.random() < 0.35} for node in range(7)}
+    expected: Set[Tuple[Node, ...]] = set()
+    for size in range(2, 8):
+        for nodes in permutations(range(7), size):
+            if nodes[0] == min(nodes) and is_cycle(list(nodes), small):
+                expected.add(nodes)
+    assert set(map(canonical, elementary_cycles(small))) == expected
+    for max_length in (2, 3, 4):
+        assert set(map(canonical, elementary_cycles(small, max_length=max_length))) == {cycle for cycle in expected if len(cycle) <= max_length}
+
+    # Benchmark
+    # - many small cyclic regions : 2,000 complete digraphs on 4 nodes , chained by one-way edges
+    regions: int = 2_000
+    chained: Dict[Node, Set[Node]] = {}
+    for region in range(regions):
+        base: Node = region * 4
+        for node in range(base, base + 4):
+            chained[node] = {other for other in range(base, base + 4) if other != node}
+        if region:
+            chained[base - 1].add(base)
+    started: float = time.perf_counter()
+    count: int = sum(1 for _ in elementary_cycles(chained))
+    seconds: float = time.perf_counter() - started
+    assert count == 20 * regions
+    print(f"\n{count:,} cycles in {regions:,} regions , {seconds:.2f}s ( {count / seconds:,.0f} cycles/s )")
+    started = time.perf_counter()
+    assert sum(1 for _ in elementary_cycles(chained, time_limit=0.05)) < count
+    print(f"time_limit=0.05 : stopped after {time.perf_counter() - started:.2f}s")
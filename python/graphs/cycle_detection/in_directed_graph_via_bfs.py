@@ -0,0 +1,118 @@
+"""
+Cycle Detection ( in Directed Graph , using BFS )
+=================================================
+
+- a plain BFS can't detect a directed cycle : an edge to an already visited node may just be a cross edge
+    ( `0 --> 1 , 0 --> 2 , 1 --> 2` has no cycle , yet `2` is seen twice )
+- but Kahn's algorithm *is* a BFS : the queue starts with the in-degree `0` nodes ,
+    and a node is queued once all it's in-edges are consumed
+    - nodes never queued are on a cycle ( or reachable from one ) , that's `leftover` of `in_directed_graph_via_kahns`
+        ( the order nodes are taken out in doesn't change which are left over )
+
+Witness Cycle ( shortest through a node ) :
+
+- pick a node known to be on a cycle ( `cycle_among` )
+- BFS from it , over the left over nodes only , until an edge leads back to it
+    - BFS reaches every node by a fewest-edges path , so that's the shortest cycle through the node
+
+- the whole graph is scanned , in `O(V + E)`
+
+    - Note
+        - a cycle is returned as `[v0, v1, ..., vk]` : edges `v0 --> v1 --> ... --> vk --> v0`
+
+python3 -m cycle_detection.in_directed_graph_via_bfs
+"""
+from typing import *
+from collections import deque
+from graph_representation import AdjacencyView
+from cycle_detection.in_directed_graph_via_kahns import leftover, cycle_among
+from cycle_detection.in_directed_graph_via_dfs import (
+    GRAPH_WITH_CYCLE_REPRESENTATION, GRAPH_WITHOUT_CYCLE_REPRESENTATION, graph_with_cycle, graph_without_cycle,
+)
+
+# Custom Types
+
+# - a node ( vertex ) type
+Node = NewType('Node', int)
+# - a graph type
+#       - any representation following the neighbour access protocol ( dict / `Graph` / `CSR` )
+Graph = AdjacencyView[Node] # Adjacency List
+
+# ---
+
+def find_cycle(graph: Graph) -> List[Node]:
+    """
+    shortest cycle through one node of a cycle of `graph` , empty if there is none
+    """
+    nodes: Set[Node] = leftover(graph)
+    if not nodes:
+        return []
+    start: Node = cycle_among(graph, nodes)[0]
+
+    parent: Dict[Node, Node] = {start: start}
+    visiting_queue: Deque[Node] = deque([start])
+    while len(visiting_queue) > 0:
+
+        current_node: Node = visiting_queue.popleft()
+        for neighbour in graph[current_node]:
+            if neighbour == start:
+                # - back to where we started , `start --> ... --> current_node --> start`
+                cycle: List[Node] = [current_node]
+                while cycle[-1] != start:
+                    cycle.append(parent[cycle[-1]])
+                cycle.reverse()
+                return cycle
+            if neighbour in nodes and neighbour not in parent:
+                parent[neighbour] = current_node
+                visiting_queue.append(neighbour)
+    return [] # unreachable , `start` is on a cycle
+
+def detect(graph: Graph) -> bool:
+    """
+    Detect Cycle
+    """
+    return len(leftover(graph)) > 0
+
+# Testing Entrypoint
+# ------------------
+if __name__ == "__main__":
+    import time
+    from generators import random_csr, random_dag_csr
+    from cycle_detection import in_directed_graph_via_dfs, in_directed_graph_via_kahns
+
+    message = lambda result: '--- [ Cycle Detected ] ---' if result == True else '--- [ NO Cycle Detected ] ---'
+
+    def is_cycle(cycle: List[Node], graph: Graph) -> bool:
+        return len(cycle) > 0 and all(cycle[(index + 1) % len(cycle)] in graph[node] for index, node in enumerate(cycle))
+
+    result = detect(graph_with_cycle)
+    print("\tCheckin for ", GRAPH_WITH_CYCLE_REPRESENTATION, '\n\t', message(result))
+    assert result == True
+    assert sorted(find_cycle(graph_with_cycle)) == [1, 2, 3] and is_cycle(find_cycle(graph_with_cycle), graph_with_cycle)
+
+    print('\n', '-'*20, '\n')
+
+    result = detect(graph_without_cycle)
+    print("\tCheckin for ", GRAPH_WITHOUT_CYCLE_REPRESENTATION, '\n\t', message(result))
+    assert result == False and find_cycle(graph_without_cycle) == []
+
+    # - a long cycle with a shortcut : the shortest one through the node is found
+    graph: Graph = {0: [1], 1: [2, 4], 2: [3], 3: [4], 4: [0], 5: [0]}
+    assert is_cycle(find_cycle(graph), graph) and len(find_cycle(graph)) == 3
+
+    # Benchmark
+    # - the three detectors , whole graph scan , with & without a cycle
+    print(f"\n{'Directed Cycle Detection':^62}")
+    print("+", "-" * 58, "+")
+    print(f"| {'graph':<14} | {'dfs (s)':>9} | {'kahns (s)':>9} | {'bfs (s)':>9} | {'cycle':>5} |")
+    print("+", "-" * 58, "+")
+    for name, csr in (('DAG', random_dag_csr(200_000, 5, seed=46)), ('random', random_csr(200_000, 5, seed=46))):
+        timings: List[float] = []
+        cycles: List[List[Node]] = []
+        for detector in (in_directed_graph_via_dfs.find_cycle, in_directed_graph_via_kahns.find_cycle, find_cycle):
+            started: float = time.perf_counter()
+            cycles.append(detector(csr))
+            timings.append(time.perf_counter() - started)
+        assert all(bool(cycle) == bool(cycles[0]) and (not cycle or is_cycle(cycle, csr)) for cycle in cycles)
+        print(f"| {name:<14} | {timings[0]:>9.2f} | {timings[1]:>9.2f} | {timings[2]:>9.2f} | {len(cycles[2]):>5} |")
+    print("+", "-" * 58, "+")
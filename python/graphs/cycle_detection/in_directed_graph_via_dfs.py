@@ -0,0 +1,134 @@
+"""
+Cycle Detection ( in Directed Graph , using DFS )
+=================================================
+
+- in a directed graph , a cycle exists if and only if a DFS finds a `BACK` edge ,
+    i.e an edge to a node that is still open ( on the DFS stack )
+- three colors :
+    - white : not discovered yet
+    - gray  : discovered , not finished ( still on the stack )
+    - black : finished
+- the DFS engine ( `traversal.dfs.traverse` ) keeps exactly that : `discovery` / `finish` times ,
+    and types every edge , so we stop it on the first `BACK` edge `node --> ancestor`
+- the cycle itself is then on the stack : `ancestor --> ... --> node` ( via `parent` ) , and back to `ancestor`
+
+- the whole graph is scanned ( every node is a root , unless already reached ) , in `O(V + E)`
+- iterative , so no recursion limit on long paths
+
+    - Note
+        - nodes must be named `0 .. n-1`
+        - a cycle is returned as `[v0, v1, ..., vk]` : edges `v0 --> v1 --> ... --> vk --> v0`
+
+python3 -m cycle_detection.in_directed_graph_via_dfs
+"""
+from typing import *
+from graph_representation import AdjacencyView
+from traversal.dfs import BACK, DFSResult, traverse
+
+# Custom Types
+
+# - a node ( vertex ) type
+Node = NewType('Node', int)
+# - a graph type
+#       - any representation following the neighbour access protocol ( dict / `Graph` / `CSR` )
+Graph = AdjacencyView[Node] # Adjacency List
+
+# ---
+
+GRAPH_WITH_CYCLE_REPRESENTATION = """
+
+            Edge Explaination
+
+                    0 --> 1
+                    1 --> 2
+                    2 --> 3
+                    3 --> 1     ( closes 1 --> 2 --> 3 --> 1 )
+                    3 --> 4
+"""
+
+# Graph ( in adjacency list repr )
+graph_with_cycle: Graph = {
+    0: { 1 },
+    1: { 2 },
+    2: { 3 },
+    3: { 1, 4 },
+    4: set()
+}
+
+GRAPH_WITHOUT_CYCLE_REPRESENTATION = """
+
+            Edge Explaination
+
+                    0 --> 1
+                    0 --> 2
+                    1 --> 2
+                    1 --> 3
+                    2 --> 4
+                    3 --> 2
+                    3 --> 4
+"""
+
+# Graph ( in adjacency list repr )
+graph_without_cycle: Graph = {
+    0: { 1, 2 },
+    1: { 2, 3 },
+    2: { 4 },
+    3: { 2, 4 },
+    4: set()
+}
+
+# ---
+
+def find_cycle(graph: Graph) -> List[Node]:
+    """
+    one cycle of `graph` , empty if there is none
+    """
+    back_edge: List[Tuple[Node, Node]] = []
+
+    def stop_on_back_edge(node: Node, neighbour: Node, edge_type: str) -> bool:
+        if edge_type == BACK:
+            back_edge.append((node, neighbour))
+            return True
+
+    result: DFSResult = traverse(graph, on_edge=stop_on_back_edge)
+    if not back_edge:
+        return []
+    node, ancestor = back_edge[0]
+    cycle: List[Node] = [node]
+    while cycle[-1] != ancestor:
+        cycle.append(result.parent[cycle[-1]])
+    cycle.reverse()
+    return cycle
+
+def detect(graph: Graph) -> bool:
+    """
+    Detect Cycle
+    """
+    return len(find_cycle(graph)) > 0
+
+# Testing Entrypoint
+# ------------------
+if __name__ == "__main__":
+    from graph_representation import CSR
+
+    message = lambda result: '--- [ Cycle Detected ] ---' if result == True else '--- [ NO Cycle Detected ] ---'
+
+    def is_cycle(cycle: List[Node], graph: Graph) -> bool:
+        return len(cycle) > 0 and all(cycle[(index + 1) % len(cycle)] in graph[node] for index, node in enumerate(cycle))
+
+    result = detect(graph_with_cycle)
+    print("\tCheckin for ", GRAPH_WITH_CYCLE_REPRESENTATION, '\n\t', message(result))
+    assert result == True
+    assert find_cycle(graph_with_cycle) == [1, 2, 3]
+
+    print('\n', '-'*20, '\n')
+
+    result = detect(graph_without_cycle)
+    print("\tCheckin for ", GRAPH_WITHOUT_CYCLE_REPRESENTATION, '\n\t', message(result))
+    assert result == False
+
+    # - a cycle not reachable from node `0` , a self loop , and a long path ( no recursion limit )
+    assert is_cycle(find_cycle({0: [1], 1: [], 2: [3], 3: [4], 4: [2]}), {0: [1], 1: [], 2: [3], 3: [4], 4: [2]})
+    assert find_cycle({0: [0]}) == [0]
+    chain: CSR = CSR.from_adjacency({node: [node + 1] for node in range(99_999)} | {99_999: [0]})
+    assert len(find_cycle(chain)) == 100_000
@@ -0,0 +1,121 @@
+"""
+Cycle Detection ( in Directed Graph , using Kahn's Algorithm )
+==============================================================
+
+- Kahn's algorithm keeps removing nodes with in-degree `0`
+- a node on a cycle never gets there : one of it's in-edges comes from the cycle , which is never removed
+- so the graph has a cycle if and only if some nodes are *left over* ( leftover count > 0 )
+
+Witness Cycle :
+
+- a left over node still has in-degree > 0 , i.e a predecessor that is left over too
+- so from any left over node , keep stepping to a left over predecessor
+    - there are finitely many , so a node repeats , and the steps between the repeats are a cycle ( walked backwards )
+
+- the whole graph is scanned , in `O(V + E)`
+
+    - Note
+        - a cycle is returned as `[v0, v1, ..., vk]` : edges `v0 --> v1 --> ... --> vk --> v0`
+
+python3 -m cycle_detection.in_directed_graph_via_kahns
+"""
+from typing import *
+from graph_representation import AdjacencyView
+from sorting.topological_sort.kahn_algorithm_topological_sort import get_in_degree_map, get_nodes_with_in_degree_zero
+from cycle_detection.in_directed_graph_via_dfs import (
+    GRAPH_WITH_CYCLE_REPRESENTATION, GRAPH_WITHOUT_CYCLE_REPRESENTATION, graph_with_cycle, graph_without_cycle,
+)
+
+# Custom Types
+
+# - a node ( vertex ) type
+Node = NewType('Node', int)
+# - a graph type
+#       - any representation following the neighbour access protocol ( dict / `Graph` / `CSR` )
+Graph = AdjacencyView[Node] # Adjacency List
+
+# ---
+
+def leftover(graph: Graph) -> Set[Node]:
+    """
+    nodes Kahn's algorithm can't remove ( on a cycle , or reachable from one )
+    """
+    in_degree_map: Dict[Node, int] = get_in_degree_map(graph)
+    nodes_with_no_incomming_edge: List[Node] = get_nodes_with_in_degree_zero(graph, in_degree_map)
+    removed_count: int = 0
+
+    while len(nodes_with_no_incomming_edge) > 0:
+
+        in_degree_zero_node: Node = nodes_with_no_incomming_edge.pop()
+        removed_count += 1
+        for node in graph[in_degree_zero_node]:
+            in_degree_map[node] -= 1
+            if in_degree_map[node] == 0:
+                nodes_with_no_incomming_edge.append(node)
+
+    if removed_count == len(graph):
+        return set()
+    return {node for node, in_degree in in_degree_map.items() if in_degree > 0}
+
+def cycle_among(graph: Graph, nodes: Set[Node]) -> List[Node]:
+    """
+    one cycle through the left over `nodes` ( result of `leftover` ) , empty if there are none
+    """
+    if not nodes:
+        return []
+    # - one left over predecessor per left over node is enough
+    predecessor: Dict[Node, Node] = {}
+    for node in nodes:
+        for neighbour in graph[node]:
+            if neighbour in nodes:
+                predecessor.setdefault(neighbour, node)
+
+    # - walk back until a node repeats
+    step: Dict[Node, int] = {}
+    walk: List[Node] = []
+    node: Node = next(iter(nodes))
+    while node not in step:
+        step[node] = len(walk)
+        walk.append(node)
+        node = predecessor[node]
+    cycle: List[Node] = walk[step[node]:]
+    cycle.reverse()
+    return cycle
+
+def find_cycle(graph: Graph) -> List[Node]:
+    """
+    one cycle of `graph` , empty if there is none
+    """
+    return cycle_among(graph, leftover(graph))
+
+def detect(graph: Graph) -> bool:
+    """
+    Detect Cycle
+    """
+    return len(leftover(graph)) > 0
+
+# Testing Entrypoint
+# ------------------
+if __name__ == "__main__":
+
+    message = lambda result: '--- [ Cycle Detected ] ---' if result == True else '--- [ NO Cycle Detected ] ---'
+
+    def is_cycle(cycle: List[Node], graph: Graph) -> bool:
+        return len(cycle) > 0 and all(cycle[(index + 1) % len(cycle)] in graph[node] for index, node in enumerate(cycle))
+
+    result = detect(graph_with_cycle)
+    print("\tCheckin for ", GRAPH_WITH_CYCLE_REPRESENTATION, '\n\t', message(result))
+    assert result == True
+    assert leftover(graph_with_cycle) == {1, 2, 3, 4}
+    assert sorted(find_cycle(graph_with_cycle)) == [1, 2, 3] and is_cycle(find_cycle(graph_with_cycle), graph_with_cycle)
+
+    print('\n', '-'*20, '\n')
+
+    result = detect(graph_without_cycle)
+    print("\tCheckin for ", GRAPH_WITHOUT_CYCLE_REPRESENTATION, '\n\t', message(result))
+    assert result == False and find_cycle(graph_without_cycle) == []
+
+    # - a cycle not reachable from node `0` , with nodes downstream of it , and a self loop
+    graph: Graph = {0: [1], 1: [], 2: [3], 3: [4, 5], 4: [2], 5: [6], 6: []}
+    assert leftover(graph) == {2, 3, 4, 5, 6} and is_cycle(find_cycle(graph), graph)
+    assert find_cycle({0: [0], 1: [0]}) == [0]
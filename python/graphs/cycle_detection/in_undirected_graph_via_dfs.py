@@ -4,13 +4,15 @@ Cycle Detection ( using DFS )
 
 """
 from typing import *
+from graph_representation import AdjacencyView
 
 # Custom Types
 
 # - a node ( vertex ) type
 Node = NewType('Node', int)
 # - a graph type
-Graph = NewType('Graph', Dict[Node, Set]) # Adjacency List
+#       - any representation following the neighbour access protocol ( dict / `Graph` / `CSR` )
+Graph = AdjacencyView[Node] # Adjacency List
 
 # ---
 
@@ -0,0 +1,97 @@
+"""
+Cycle Detection ( in Undirected Graph , using Union-Find )
+==========================================================
+
+- every edge `u -- v` either joins two separate trees , or closes a cycle ( `u` & `v` were already connected )
+- union-find ( `ConnectedComponents` ) tells which , in near `O(1)` per edge
+    - `add_edge(u, v)` returns `False` ( no components merged ) => the edge closes a cycle
+- so we never need the adjacency , just a stream of edges , each seen once
+    - every component is covered , whatever node the edges start from
+    - `O(E * α(V))` time , `O(V)` memory
+
+    - Note
+        - nodes are `0 .. n-1` , new nodes are added as they show up
+        - a self loop `u -- u` , or the same edge twice , is a cycle too
+        - an adjacency list stores every edge both ways , `edges_of` yields each once
+
+python3 -m cycle_detection.in_undirected_graph_via_union_find
+"""
+from typing import *
+from graph_representation import AdjacencyView
+from connected_components.union_find import ConnectedComponents
+
+# Custom Types
+
+# - a node ( vertex ) type
+Node = NewType('Node', int)
+# - an edge type
+Edge = Tuple[Node, Node]
+# - a graph type
+#       - any representation following the neighbour access protocol ( dict / `Graph` / `CSR` )
+Graph = AdjacencyView[Node] # Adjacency List
+
+# ---
+
+def edges_of(graph: Graph) -> Iterator[Edge]:
+    """every edge of an un-directed adjacency list , once ( `u <= v` )"""
+    for node in graph:
+        for neighbour in graph[node]:
+            if node <= neighbour:
+                yield node, neighbour
+
+def first_cycle_edge(edges: Iterable[Edge], node_count: int = 0) -> Optional[Edge]:
+    """
+    the first edge of the stream that closes a cycle , `None` if there is none
+
+    - `node_count` : nodes known up front ( saves growing the components )
+    """
+    components: ConnectedComponents = ConnectedComponents(node_count)
+    for u, v in edges:
+        if not components.add_edge(u, v):
+            return u, v
+    return None
+
+def detect(edges: Iterable[Edge], node_count: int = 0) -> bool:
+    """
+    Detect Cycle
+    """
+    return first_cycle_edge(edges, node_count) is not None
+
+# Testing Entrypoint
+# ------------------
+if __name__ == "__main__":
+    import random
+    import time
+    from cycle_detection.in_undirected_graph_via_dfs import (
+        GRAPH_WITH_CYCLE_REPRESENTATION, GRAPH_WITHOUT_CYCLE_REPRESENTATION, graph_with_cycle, graph_without_cycle,
+    )
+
+    message = lambda result: '--- [ Cycle Detected ] ---' if result == True else '--- [ NO Cycle Detected ] ---'
+
+    result = detect(edges_of(graph_with_cycle))
+    print("\tCheckin for ", GRAPH_WITH_CYCLE_REPRESENTATION, '\n\t', message(result))
+    assert result == True
+    assert first_cycle_edge([(0, 1), (0, 2), (1, 3), (2, 3), (2, 4)]) == (2, 3)
+
+    print('\n', '-'*20, '\n')
+
+    result = detect(edges_of(graph_without_cycle))
+    print("\tCheckin for ", GRAPH_WITHOUT_CYCLE_REPRESENTATION, '\n\t', message(result))
+    assert result == False
+
+    # - a cycle away from node `0` , a self loop , a repeated edge
+    assert first_cycle_edge([(0, 1), (5, 6), (6, 7), (7, 5)]) == (7, 5)
+    assert first_cycle_edge([(3, 3)]) == (3, 3)
+    assert first_cycle_edge([(1, 2), (2, 1)]) == (2, 1)
+
+    # Benchmark
+    # - a 1M node random spanning tree ( no cycle ) , then the same with one extra edge at the very end
+    node_count: int = 1_000_000
+    rng: random.Random = random.Random(47)
+    tree: List[Edge] = [(node, rng.randrange(node)) for node in range(1, node_count)]
+    rng.shuffle(tree)
+    started: float = time.perf_counter()
+    assert first_cycle_edge(tree, node_count) is None
+    tree_seconds: float = time.perf_counter() - started
+    assert first_cycle_edge(tree + [(node_count - 1, 0)]) == (node_count - 1, 0)
+    print(f"\n{len(tree):,} edges , no cycle , whole stream : {tree_seconds:.2f}s ( {len(tree) / tree_seconds:,.0f} edges/s )")
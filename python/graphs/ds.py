@@ -2,6 +2,7 @@
 Data Structures
 ===============
 """
+from __future__ import annotations
 from typing import *
 from enum import Enum
 
@@ -131,6 +132,59 @@ class PriorityQueue:
     # empty check utility
     empty = lambda self: len(self._queue) <= 0
     
+class DisjointSet:
+    """Disjoint Set ( Union-Find ) implementation
+    [Thread Un-Safe]
+
+    - elements are `0 .. size-1` , kept in plain arrays ( `parent` , `rank` )
+    - path compression ( halving ) + union by rank => near `O(1)` amortized per operation
+    """
+    def __init__(self, size: int = 0):
+        """constructor"""
+        self._parent: List[int] = list(range(size))
+        self._rank: bytearray = bytearray(size) # rank never crosses log2(size)
+        self._count: int = size
+
+    def grow(self, size: int) -> None:
+        """adds singleton sets , until there are `size` elements"""
+        if size > len(self._parent):
+            self._count += size - len(self._parent)
+            self._rank.extend(bytes(size - len(self._parent)))
+            self._parent.extend(range(len(self._parent), size))
+
+    def find(self, element: int) -> int:
+        """representative of the set holding `element`"""
+        parent: List[int] = self._parent
+        while parent[element] != element:
+            parent[element] = parent[parent[element]] # path halving
+            element = parent[element]
+        return element
+
+    def union(self, a: int, b: int) -> bool:
+        """merges the sets of `a` & `b` , `False` if they were already in the same set"""
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a == root_b:
+            return False
+        if self._rank[root_a] < self._rank[root_b]:
+            root_a, root_b = root_b, root_a
+        self._parent[root_b] = root_a
+        if self._rank[root_a] == self._rank[root_b]:
+            self._rank[root_a] += 1
+        self._count -= 1
+        return True
+
+    def connected(self, a: int, b: int) -> bool:
+        """checks if `a` & `b` are in the same set"""
+        return self.find(a) == self.find(b)
+
+    @property
+    def count(self) -> int:
+        """number of disjoint sets"""
+        return self._count
+
+    def __len__(self) -> int:
+        return len(self._parent)
+
 # Testing Entrypoint
 if __name__ == '__main__':
 
@@ -172,4 +226,15 @@ if __name__ == '__main__':
     assert (t1 in pq) == True
     assert (t2 in pq) == False
 
-    
\ No newline at end of file
+    
+
+    ds = DisjointSet(6)
+    assert ds.union(0, 1) == True
+    assert ds.union(2, 3) == True
+    assert ds.union(1, 0) == False
+    assert ds.connected(0, 1) == True and ds.connected(1, 2) == False
+    ds.union(1, 3)
+    assert ds.connected(0, 2) == True
+    assert ds.count == 3
+    ds.grow(8)
+    assert ds.count == 5 and ds.connected(7, 7) == True
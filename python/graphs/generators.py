@@ -0,0 +1,74 @@
+"""
+Graph Generators
+================
+
+- random graphs for benchmarking , built straight into a `CSR` snapshot with numpy
+    - ( building a dict of a few million edges first , is slower than the algorithms being measured )
+- all generators take a `seed` , so the same graph comes out every time
+
+python3 -m generators
+"""
+from typing import *
+from array import array
+import numpy as np
+
+from graph_representation import CSR
+
+
+def csr_from_edges(node_count: int, sources: np.ndarray, targets: np.ndarray, weights: Optional[np.ndarray] = None) -> CSR:
+    """builds a CSR from parallel edge arrays ( `sources[i] --> targets[i]` )"""
+    order: np.ndarray = np.argsort(sources, kind='stable')
+    offsets: np.ndarray = np.zeros(node_count + 1, dtype=np.int64)
+    np.cumsum(np.bincount(sources, minlength=node_count), out=offsets[1:])
+    sorted_weights: Optional[array] = None
+    if weights is not None:
+        typecode: str = 'q' if np.issubdtype(weights.dtype, np.integer) else 'd'
+        sorted_weights = array(typecode, weights[order].astype(np.int64 if typecode == 'q' else np.float64).tobytes())
+    return CSR(
+        array('q', offsets.tobytes()),
+        array('q', targets[order].astype(np.int64).tobytes()),
+        sorted_weights,
+    )
+
+
+def random_csr(node_count: int, average_degree: int, seed: int = 0, max_weight: Optional[int] = None) -> CSR:
+    """
+    directed graph with `node_count * average_degree` uniformly random edges
+        - `max_weight` : adds integer weights in `1 .. max_weight`
+    """
+    rng: np.random.Generator = np.random.default_rng(seed)
+    edge_count: int = node_count * average_degree
+    sources: np.ndarray = rng.integers(0, node_count, edge_count)
+    targets: np.ndarray = rng.integers(0, node_count, edge_count)
+    weights: Optional[np.ndarray] = rng.integers(1, max_weight + 1, edge_count) if max_weight else None
+    return csr_from_edges(node_count, sources, targets, weights)
+
+
+def random_dag_csr(node_count: int, average_degree: int, seed: int = 0, max_weight: Optional[int] = None) -> CSR:
+    """
+    directed acyclic graph , every edge goes from a lower to a higher position of a hidden random order
+        - node ids are shuffled , so id order is not a topological order
+    """
+    rng: np.random.Generator = np.random.default_rng(seed)
+    edge_count: int = node_count * average_degree
+    first: np.ndarray = rng.integers(0, node_count, edge_count)
+    second: np.ndarray = rng.integers(0, node_count, edge_count)
+    keep: np.ndarray = first != second
+    low, high = np.minimum(first[keep], second[keep]), np.maximum(first[keep], second[keep])
+    position_to_node: np.ndarray = rng.permutation(node_count)
+    weights: Optional[np.ndarray] = rng.integers(1, max_weight + 1, low.size) if max_weight else None
+    return csr_from_edges(node_count, position_to_node[low], position_to_node[high], weights)
+
+
+# Testing Entrypoint
+# ------------------
+if __name__ == '__main__':
+    from sorting.topological_sort.kahn_algorithm_topological_sort import topological_sort_v2
+
+    csr: CSR = random_csr(1000, 4, seed=1, max_weight=9)
+    assert len(csr) == 1000 and csr.edge_count == 4000
+    assert all(1 <= weight <= 9 for weight in csr.weights)
+    assert random_csr(1000, 4, seed=1).targets == csr.targets
+
+    dag: CSR = random_dag_csr(1000, 4, seed=1)
+    assert len(topological_sort_v2(dag)) == 1000
@@ -1,7 +1,10 @@
 """
 
 """
-from typing import NewType, List, Tuple, Optional, Dict, Union, Any
+from typing import NewType, List, Tuple, Optional, Dict, Union, Any, Protocol, TypeVar, Iterable, Iterator
+from collections.abc import Mapping, Sequence
+from array import array
+import threading
 
 
 class Types:
@@ -9,6 +12,36 @@ class Types:
     Node = NewType('Node', int)
 
 
+# - a neighbour type ( `Node` for plain graphs , `( Node, EdgeWeight )` for weighted graphs )
+Neighbour = TypeVar('Neighbour', covariant=True)
+
+
+class AdjacencyView(Protocol[Neighbour]):
+    """
+    Neighbour Access Protocol
+    =========================
+    - every algorithm module reads a graph only through these 3 operations
+        - `for node in graph`   : iterate over all nodes
+        - `graph[node]`         : iterate over the neighbours of a node
+        - `len(graph)`          : count of nodes
+    - so any representation supporting them can be passed in directly , without
+        converting it into a per-algorithm dict copy .
+
+    Implemented By :
+        - plain dicts ( `{ node: { neighbours } }` ) , as used in the algorithm modules
+        - `Graph` ( reads through it's adjacency list )
+        - `CSR` ( a compact , read-only snapshot )
+
+    NOTE:
+        - for weighted graphs , neighbours are `( neighbour_node, edge_weight )` tuples
+    """
+    def __getitem__(self, node: Types.Node) -> Iterable[Neighbour]: ...
+
+    def __iter__(self) -> Iterator[Types.Node]: ...
+
+    def __len__(self) -> int: ...
+
+
 class RepresentationOption:
     """
     Graphs Representation Options
@@ -41,22 +74,166 @@ class RepresentationOption:
     EDGE_LIST = "EDGE_LIST"
 
 
+class _CopyOnWriteChunks:
+    """
+    Copy-On-Write Chunk Store
+    =========================
+    - per-node records ( neighbour lists / matrix rows ) are kept in fixed size chunks
+    - `release()` hands the chunk table out to a snapshot , after which every chunk is shared
+    - the first write into a shared chunk copies only that chunk ( and the record being written ) ,
+        so taking a snapshot costs `O(V / CHUNK_SIZE)` and never copies the whole graph
+
+    [Thread Un-Safe] : writes & `release()` must be serialized by the owner ( `Graph` holds a lock )
+    """
+    CHUNK_SIZE: int = 64
+
+    def __init__(self, chunks: Union[list, tuple] = (), length: int = 0):
+        self._chunks: list = list(chunks)
+        self._length: int = length
+        self._owned_chunks: set = set()     # chunks private to this store ( safe to write in place )
+        self._owned_records: set = set()    # records private to this store ( safe to write in place )
+
+    def release(self) -> Tuple[tuple, int]:
+        """shares the current chunks with a snapshot"""
+        self._owned_chunks = set()
+        self._owned_records = set()
+        return tuple(self._chunks), self._length
+
+    def _own_chunk(self, index: int):
+        """makes a chunk private , copying it if it's shared"""
+        if index not in self._owned_chunks:
+            self._chunks[index] = self._chunks[index].copy()
+            self._owned_chunks.add(index)
+        return self._chunks[index]
+
+    def _own_record(self, chunk, slot: int, key: int) -> list:
+        """makes a record private , copying it if it's shared"""
+        if key not in self._owned_records:
+            chunk[slot] = list(chunk[slot])
+            self._owned_records.add(key)
+        return chunk[slot]
+
+    def __len__(self) -> int:
+        return self._length
+
+
+class _AdjacencyTable(_CopyOnWriteChunks, Mapping):
+    """
+    `{ node: [neighbours] }` mapping on top of copy-on-write chunks
+        - chunk `i` is a dict holding nodes `i * CHUNK_SIZE .. (i + 1) * CHUNK_SIZE - 1`
+    """
+    def __getitem__(self, node: Types.Node) -> List[Types.Node]:
+        index: int = node // self.CHUNK_SIZE
+        if not 0 <= index < len(self._chunks):
+            raise KeyError(node)
+        return self._chunks[index][node]
+
+    def __iter__(self) -> Iterator[Types.Node]:
+        for chunk in self._chunks:
+            yield from chunk
+
+    def put(self, node: Types.Node, neighbours: List[Types.Node]) -> None:
+        """adds ( or resets ) the neighbour list of a node"""
+        index: int = node // self.CHUNK_SIZE
+        while len(self._chunks) <= index:
+            self._owned_chunks.add(len(self._chunks))
+            self._chunks.append({})
+        chunk: dict = self._own_chunk(index)
+        if node not in chunk:
+            self._length += 1
+        chunk[node] = neighbours
+        self._owned_records.add(node)
+
+    def writable(self, node: Types.Node) -> List[Types.Node]:
+        """neighbour list of a node , safe to change in place"""
+        self[node] # raises `KeyError` for an unknown node
+        index: int = node // self.CHUNK_SIZE
+        return self._own_record(self._own_chunk(index), node, node)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
+class _MatrixTable(_CopyOnWriteChunks, Sequence):
+    """
+    list of matrix rows on top of copy-on-write chunks
+        - chunk `i` is a list holding rows `i * CHUNK_SIZE .. (i + 1) * CHUNK_SIZE - 1`
+    """
+    def __getitem__(self, row: int) -> List[bool]:
+        if not 0 <= row < self._length:
+            raise IndexError(row)
+        return self._chunks[row // self.CHUNK_SIZE][row % self.CHUNK_SIZE]
+
+    def append(self, cells: List[bool]) -> None:
+        """adds a row at the bottom"""
+        index: int = self._length // self.CHUNK_SIZE
+        if index == len(self._chunks):
+            self._owned_chunks.add(index)
+            self._chunks.append([])
+        self._own_chunk(index).append(cells)
+        self._owned_records.add(self._length)
+        self._length += 1
+
+    def writable(self, row: int) -> List[bool]:
+        """a row , safe to change in place"""
+        self[row] # raises `IndexError` for an unknown row
+        return self._own_record(self._own_chunk(row // self.CHUNK_SIZE), row % self.CHUNK_SIZE, row)
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
+class _PrefixView(Sequence):
+    """read-only view on the first `length` items of an append-only list"""
+    def __init__(self, items: list, length: int):
+        self._items = items
+        self._length = length
+
+    def __getitem__(self, index: int):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._length))]
+        if not -self._length <= index < self._length:
+            raise IndexError(index)
+        return self._items[index % self._length]
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
 class Graph:
     """
     Graph Handling Class
     ====================
     - For keeping things simple , we have assumed that you name your nodes
         with positive integer value identifier only .
+    - every mutation bumps `version` ; `snapshot()` pins the current version for readers ( see `GraphSnapshot` )
 
     NOTE:
         - !WARNING : please add nodes in incremental order only .
         - !WARNING : please start node counter from `0` .
+        - a single writer is assumed , readers on other threads shall read through a snapshot
     """
     def __init__(self):
-        self._adjacency_list:   Dict[Types.Node, List[Types.Node]] = {}
-        self._adjacency_matrix: List[List[bool]] = []
-        self._edge_list:        List[Tuple[Types.Node, Types.Node, Optional[int]]] = []
+        self._adjacency_list:   _AdjacencyTable = _AdjacencyTable()
+        self._adjacency_matrix: _MatrixTable = _MatrixTable()
+        self._edge_list:        List[Tuple[Types.Node, Types.Node, Optional[int]]] = [] # append only , hence shared with snapshots as is
         self._meta:             Dict[str, Any] = {}
+        self._version:          int = 0
+        self._lock:             threading.Lock = threading.Lock()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """everything but the lock , so a graph can be deep-copied / pickled ( e.g sent to a process pool )"""
+        with self._lock:
+            state: Dict[str, Any] = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
     
     @property
     def meta(self) -> Dict[str, Any]:
@@ -68,62 +245,108 @@ class Graph:
         return self._meta
     
     @property
-    def adjacency_list(self) -> List[Types.Node]:
+    def version(self) -> int:
+        """mutation counter , bumped on every `add_node` / `add_edge`"""
+        return self._version
+
+    @property
+    def adjacency_list(self) -> Mapping[Types.Node, List[Types.Node]]:
         return self._adjacency_list
     
     @property
-    def adjacency_matrix(self) -> List[Types.Node]:
+    def adjacency_matrix(self) -> Sequence[List[bool]]:
         return self._adjacency_matrix
     
     @property
-    def edge_list(self) -> List[Types.Node]:
+    def edge_list(self) -> List[Tuple[Types.Node, Types.Node, Optional[int]]]:
         return self._edge_list
     
     def add_node(self, value: Types.Node, to_representation: Optional[RepresentationOption] = None) -> None:
         """
         
         """
+        with self._lock:
+            self._add_node(value, to_representation)
+            self._version += 1
+
+    def _add_node(self, value: Types.Node, to_representation: Optional[RepresentationOption] = None) -> None:
         match to_representation:
 
             case RepresentationOption.ADJACENCY_LIST:
-                self._adjacency_list[value] = []
+                self._adjacency_list.put(value, [])
             
             case RepresentationOption.ADJACENCY_MATRIX:
                 elem = len(self._adjacency_matrix[0]) if self._adjacency_matrix else 0
                 self._adjacency_matrix.append([False]*elem)
-                for row in self._adjacency_matrix:
-                    row.append(False)
+                for row in range(len(self._adjacency_matrix)):
+                    self._adjacency_matrix.writable(row).append(False)
             
             case RepresentationOption.EDGE_LIST:
                 ...
             
             case _:
-                self.add_node(value, to_representation=RepresentationOption.ADJACENCY_LIST)
-                self.add_node(value, to_representation=RepresentationOption.ADJACENCY_MATRIX)
-                self.add_node(value, to_representation=RepresentationOption.EDGE_LIST)
+                self._add_node(value, to_representation=RepresentationOption.ADJACENCY_LIST)
+                self._add_node(value, to_representation=RepresentationOption.ADJACENCY_MATRIX)
+                self._add_node(value, to_representation=RepresentationOption.EDGE_LIST)
 
     def add_edge(self, value: Tuple[Types.Node, Types.Node], to_representation: Optional[RepresentationOption]=None) -> None:
         """
         
         """
+        with self._lock:
+            self._add_edge(value, to_representation)
+            self._version += 1
+
+    def _add_edge(self, value: Tuple[Types.Node, Types.Node], to_representation: Optional[RepresentationOption]=None) -> None:
         _from: Types.Node = value[0]
         _to: Types.Node = value[1]
 
         match to_representation:
         
             case RepresentationOption.ADJACENCY_LIST:
-                self._adjacency_list[_from].append(_to)
+                self._adjacency_list.writable(_from).append(_to)
             
             case RepresentationOption.ADJACENCY_MATRIX:
-                self._adjacency_matrix[_from][_to] = True
+                self._adjacency_matrix.writable(_from)[_to] = True
             
             case RepresentationOption.EDGE_LIST:
                 self._edge_list.append((_from, _to))
             
             case _:
-                self.add_edge(value, to_representation=RepresentationOption.ADJACENCY_LIST)
-                self.add_edge(value, to_representation=RepresentationOption.ADJACENCY_MATRIX)
-                self.add_edge(value, to_representation=RepresentationOption.EDGE_LIST)
+                self._add_edge(value, to_representation=RepresentationOption.ADJACENCY_LIST)
+                self._add_edge(value, to_representation=RepresentationOption.ADJACENCY_MATRIX)
+                self._add_edge(value, to_representation=RepresentationOption.EDGE_LIST)
+
+    def snapshot(self) -> 'GraphSnapshot':
+        """
+        pins the current version for readers
+            - costs `O(V / CHUNK_SIZE)` , chunks are copied later only when the writer touches them
+        """
+        with self._lock:
+            adjacency_chunks, node_count = self._adjacency_list.release()
+            matrix_chunks, row_count = self._adjacency_matrix.release()
+            return GraphSnapshot(
+                origin=self,
+                version=self._version,
+                adjacency_list=_AdjacencyTable(adjacency_chunks, node_count),
+                adjacency_matrix=_MatrixTable(matrix_chunks, row_count),
+                edge_list=_PrefixView(self._edge_list, len(self._edge_list)),
+            )
+
+    def to_csr(self) -> 'CSR':
+        """takes a CSR snapshot of the adjacency list"""
+        return CSR.from_adjacency(self)
+
+    # Neighbour Access Protocol ( see `AdjacencyView` )
+
+    def __getitem__(self, node: Types.Node) -> List[Types.Node]:
+        return self._adjacency_list[node]
+
+    def __iter__(self) -> Iterator[Types.Node]:
+        return iter(self._adjacency_list)
+
+    def __len__(self) -> int:
+        return len(self._adjacency_list)
 
     def __str__(self):
         return f"""
@@ -138,6 +361,193 @@ class Graph:
         """
 
 
+class GraphSnapshot:
+    """
+    Graph Snapshot
+    ==============
+    - a read-only , consistent view of a `Graph` at a pinned `version`
+    - the writer may keep on mutating the graph , the snapshot never sees those changes
+    - safe to read from any number of threads
+
+    - chunks of the graph are shared with the snapshot ( copy-on-write ) ,
+        so holding many snapshots costs only the chunks the writer has touched since .
+    """
+    def __init__(self, origin: Graph, version: int, adjacency_list: _AdjacencyTable, adjacency_matrix: _MatrixTable, edge_list: _PrefixView):
+        self._origin = origin
+        self._version = version
+        self._adjacency_list = adjacency_list
+        self._adjacency_matrix = adjacency_matrix
+        self._edge_list = edge_list
+
+    @property
+    def origin(self) -> Graph:
+        """the graph this snapshot was taken from"""
+        return self._origin
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    @property
+    def adjacency_list(self) -> Mapping[Types.Node, List[Types.Node]]:
+        return self._adjacency_list
+
+    @property
+    def adjacency_matrix(self) -> Sequence[List[bool]]:
+        return self._adjacency_matrix
+
+    @property
+    def edge_list(self) -> Sequence[Tuple[Types.Node, Types.Node, Optional[int]]]:
+        return self._edge_list
+
+    def to_csr(self) -> 'CSR':
+        """takes a CSR snapshot of the adjacency list"""
+        return CSR.from_adjacency(self)
+
+    # Neighbour Access Protocol ( see `AdjacencyView` )
+
+    def __getitem__(self, node: Types.Node) -> List[Types.Node]:
+        return self._adjacency_list[node]
+
+    def __iter__(self) -> Iterator[Types.Node]:
+        return iter(self._adjacency_list)
+
+    def __len__(self) -> int:
+        return len(self._adjacency_list)
+
+
+class CSR:
+    """
+    CSR ( Compressed Sparse Row ) Snapshot
+    ======================================
+    - all neighbour lists are laid out back to back in a single `targets` array
+    - `offsets[node]` to `offsets[node + 1]` is the slice of `targets` holding the neighbours of `node`
+        - hence `len(offsets) == node_count + 1`
+    - optional `weights` array runs parallel to `targets`
+
+    - it's a read-only snapshot , later changes to the source graph are not reflected .
+    - arrays are `array.array` , so they can be handed over to numpy ( `np.frombuffer` ) without a copy .
+
+    NOTE:
+        - nodes must be named `0 .. n-1` ( same as `Graph` )
+    """
+    def __init__(self, offsets: array, targets: array, weights: Optional[array] = None):
+        self._offsets = offsets
+        self._targets = targets
+        self._weights = weights
+
+    @classmethod
+    def from_adjacency(cls, graph: AdjacencyView, weighted: bool = False) -> 'CSR':
+        """
+        builds a snapshot from any neighbour access representation
+            - when `weighted` , neighbours are read as `( neighbour_node, edge_weight )` tuples
+        """
+        node_count: int = len(graph)
+        offsets: array = array('q', [0])
+        targets: array = array('q')
+        weights: list = []
+        for node in range(node_count):
+            try:
+                neighbours: Iterable = graph[node]
+            except KeyError:
+                raise Exception(f'CSR needs nodes named 0..{node_count - 1} , but node `{node}` is missing')
+            if weighted:
+                for neighbour, weight in neighbours:
+                    targets.append(neighbour)
+                    weights.append(weight)
+            else:
+                targets.extend(neighbours)
+            offsets.append(len(targets))
+        if not weighted:
+            return cls(offsets, targets)
+        typecode: str = 'q' if all(isinstance(weight, int) for weight in weights) else 'd'
+        return cls(offsets, targets, array(typecode, weights))
+
+    @property
+    def offsets(self) -> array:
+        return self._offsets
+
+    @property
+    def targets(self) -> array:
+        return self._targets
+
+    @property
+    def weights(self) -> Optional[array]:
+        return self._weights
+
+    @property
+    def edge_count(self) -> int:
+        return len(self._targets)
+
+    @property
+    def version(self) -> int:
+        """a CSR snapshot never changes"""
+        return 0
+
+    def degree(self, node: Types.Node) -> int:
+        """out-degree of a node"""
+        return self._offsets[node + 1] - self._offsets[node]
+
+    def transpose(self) -> 'CSR':
+        """
+        reverse adjacency ( every edge `u --> v` becomes `v --> u` ) , i.e in-neighbours of every node
+            - counting sort by target , `O(V + E)`
+        """
+        node_count: int = len(self)
+        offsets: array = array('q', [0]) * (node_count + 1)
+        for target in self._targets:
+            offsets[target + 1] += 1
+        for node in range(node_count):
+            offsets[node + 1] += offsets[node]
+        cursor: array = array('q', offsets[:-1])
+        targets: array = array('q', [0]) * len(self._targets)
+        weights: Optional[array] = array(self._weights.typecode, [0]) * len(self._weights) if self._weights is not None else None
+        for node in range(node_count):
+            for position in range(self._offsets[node], self._offsets[node + 1]):
+                target: int = self._targets[position]
+                targets[cursor[target]] = node
+                if weights is not None:
+                    weights[cursor[target]] = self._weights[position]
+                cursor[target] += 1
+        return CSR(offsets, targets, weights)
+
+    # Neighbour Access Protocol ( see `AdjacencyView` )
+
+    def __getitem__(self, node: Types.Node) -> Union[array, List[Tuple[Types.Node, Any]]]:
+        start, end = self._offsets[node], self._offsets[node + 1]
+        if self._weights is None:
+            return self._targets[start:end]
+        return list(zip(self._targets[start:end], self._weights[start:end]))
+
+    def __iter__(self) -> Iterator[Types.Node]:
+        return iter(range(len(self._offsets) - 1))
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __contains__(self, node: Types.Node) -> bool:
+        return isinstance(node, int) and 0 <= node < len(self._offsets) - 1
+
+
+class UnweightedView:
+    """
+    neighbour access over a weighted graph , dropping the weights
+        - `( neighbour_node, edge_weight )` => `neighbour_node`
+        - nothing is copied , neighbours are read from the wrapped graph on every access
+    """
+    def __init__(self, graph: AdjacencyView[Tuple[Types.Node, Any]]):
+        self._graph = graph
+
+    def __getitem__(self, node: Types.Node) -> List[Types.Node]:
+        return [neighbour for neighbour, _ in self._graph[node]]
+
+    def __iter__(self) -> Iterator[Types.Node]:
+        return iter(self._graph)
+
+    def __len__(self) -> int:
+        return len(self._graph)
+
+
 class Utilities:
 
     @staticmethod
@@ -275,3 +685,55 @@ if __name__ == '__main__':
     Utilities.print_adjacency_list(graph)
     Utilities.print_adjacency_matrix(graph)
     Utilities.print_edge_list(graph)
+
+    csr: CSR = graph.to_csr()
+    print("\nCSR Snapshot :\n")
+    print(f"offsets : {csr.offsets.tolist()}")
+    print(f"targets : {csr.targets.tolist()}")
+    assert [list(csr[node]) for node in csr] == [graph[node] for node in graph]
+    reverse: CSR = csr.transpose()
+    assert sorted((v, u) for u in reverse for v in reverse[u]) == sorted((u, v) for u in csr for v in csr[u])
+
+    # Snapshots
+    # - readers pin a version , the writer carries on
+    snapshot: GraphSnapshot = graph.snapshot()
+    graph.add_node(7)
+    graph.add_edge((0, 7))
+    assert snapshot.version < graph.version
+    assert 7 not in snapshot.adjacency_list and snapshot[0] == [] and graph[0] == [7]
+    assert len(snapshot.adjacency_matrix) == 7 and len(snapshot.adjacency_matrix[0]) == 7
+    assert len(snapshot.edge_list) == 9 and len(graph.edge_list) == 10
+
+    # - only the chunk touched by the writer gets copied
+    big_graph: Graph = Graph()
+    for node in range(1000):
+        big_graph.add_node(node, to_representation=RepresentationOption.ADJACENCY_LIST)
+    big_snapshot: GraphSnapshot = big_graph.snapshot()
+    big_graph.add_edge((999, 0), to_representation=RepresentationOption.ADJACENCY_LIST)
+    shared_chunks = [a is b for a, b in zip(big_snapshot.adjacency_list._chunks, big_graph.adjacency_list._chunks)]
+    assert shared_chunks.count(False) == 1 and big_snapshot[999] == []
+
+    # - concurrent readers always see a consistent structure
+    def reader(snapshot: GraphSnapshot, errors: list):
+        edge_count: int = sum(len(snapshot[node]) for node in snapshot)
+        for _ in range(200):
+            if sum(len(snapshot[node]) for node in snapshot) != edge_count:
+                errors.append(snapshot.version)
+    errors: list = []
+    readers = [threading.Thread(target=reader, args=(big_graph.snapshot(), errors)) for _ in range(4)]
+    for thread in readers:
+        thread.start()
+    for node in range(1000):
+        big_graph.add_edge((node, (node + 1) % 1000), to_representation=RepresentationOption.ADJACENCY_LIST)
+    for thread in readers:
+        thread.join()
+    assert errors == []
+
+    # - a graph can be deep-copied & pickled , the copy gets it's own lock and mutates independently
+    import copy
+    import pickle
+    for duplicate in (copy.deepcopy(graph), pickle.loads(pickle.dumps(graph))):
+        assert duplicate.version == graph.version and [duplicate[node] for node in duplicate] == [graph[node] for node in graph]
+        assert list(duplicate.adjacency_matrix) == list(graph.adjacency_matrix) and duplicate.edge_list == graph.edge_list
+        duplicate.add_edge((7, 1))
+        assert duplicate[7] == [1] and graph[7] == [] and duplicate._lock is not graph._lock
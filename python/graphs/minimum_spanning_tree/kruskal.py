@@ -94,6 +94,7 @@ GRAPH_REPRESENTATION = """
 """
 
 from typing import *
+from graph_representation import AdjacencyView
 
 # Custom Types
 
@@ -110,7 +111,8 @@ EdgeWeight = NewType('EdgeWeight', Weight)
 PathCost = NewType('PathCost', Weight)
 
 # - a graph type
-Graph = NewType('Graph', Dict[Node, Set[Tuple[Node, EdgeWeight]]]) # Weighted Adjacency List
+#       - any representation following the neighbour access protocol ( dict / `CSR` ) , yielding `( neighbour_node, edge_weight )`
+Graph = AdjacencyView[Tuple[Node, EdgeWeight]] # Weighted Adjacency List
 
 # Graph ( in adjacency list repr )
 graph_with_cycle: Graph = {
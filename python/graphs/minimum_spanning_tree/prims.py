@@ -115,6 +115,7 @@ GRAPH_REPRESENTATION = """
 
 # Imports
 from typing import *
+from graph_representation import AdjacencyView
 from dataclasses import dataclass
 from ds import PriorityQueue
 import uuid
@@ -134,7 +135,8 @@ EdgeWeight = NewType('EdgeWeight', Weight)
 PathCost = NewType('PathCost', Weight)
 
 # - a graph type
-Graph = NewType('Graph', Dict[Node, Set[Tuple[Node, EdgeWeight]]]) # Weighted Adjacency List
+#       - any representation following the neighbour access protocol ( dict / `CSR` ) , yielding `( neighbour_node, edge_weight )`
+Graph = AdjacencyView[Tuple[Node, EdgeWeight]] # Weighted Adjacency List
 
 
 # ##### Graph [_undirected_] ( in adjacency list repr )
@@ -0,0 +1,185 @@
+"""
+Reachability Index ( DAG )
+
+- question : "can `u` reach `v` ?" , asked again and again on the same DAG
+- a BFS per question is `O(V + E)` , so we pay once up front and keep a few labels per node
+
+Labels :
+
+- `rank[node]`     : position in a topological order ( `topological_sort_v2` )
+    - an edge always goes to a higher rank , so `rank[u] > rank[v]` => `u` can't reach `v`
+- `post[node]`     : position in a DFS post-order over the whole DAG ( roots in topological order )
+    - everything `u` reaches finishes before `u` , `low[u]` is the earliest of them
+- `[low[u] , post[u]]`      : every node `u` reaches lies in here ( **negative cut** , `post[v]` outside => `False` )
+- `[tree_low[u] , post[u]]` : the DFS subtree of `u` , every node in here is reached ( **positive cut** , `post[v]` inside => `True` )
+- whatever is left undecided , falls back to :
+    - `closure`  : transitive closure bitsets ( moderate sizes , `O(1)` )
+        - bit `k` of `u`'s row => `u` reaches the node of rank `rank[u] + k` ,
+            so a row only spans the ranks after `u` , and stops at the last node it reaches
+    - otherwise  : a DFS from `u` , pruned by the same cuts on every node it touches
+
+python3 -m reachability.dag_reachability
+"""
+from typing import *
+from array import array
+
+from graph_representation import AdjacencyView, Types
+from sorting.topological_sort.kahn_algorithm_topological_sort import topological_sort_v2
+from traversal.dfs import DFSResult, traverse
+
+Node = Types.Node
+
+# - above this many nodes , no closure bitsets by default ( worst case `V^2 / 16` bytes )
+CLOSURE_LIMIT: int = 16_384
+
+
+class ReachabilityIndex:
+    """
+    Reachability Index
+    [Thread Safe , read only once built]
+
+    - `graph` : a DAG following the neighbour access protocol ( wrap weighted graphs in `UnweightedView` )
+    - `closure` : build the closure bitsets , default : only up to `CLOSURE_LIMIT` nodes
+
+    - Note
+        - nodes must be named `0 .. n-1`
+        - raises , if the graph has a cycle
+    """
+    def __init__(self, graph: AdjacencyView[Node], closure: Optional[bool] = None):
+        """constructor"""
+        node_count: int = len(graph)
+        order: List[Node] = topological_sort_v2(graph)
+        forest: DFSResult = traverse(graph, order)
+        postorder: List[Node] = forest.postorder
+        self._graph: AdjacencyView[Node] = graph
+        self._rank: array = array('q', bytes(8 * node_count))
+        self._post: array = array('q', bytes(8 * node_count))
+        for position, node in enumerate(order):
+            self._rank[node] = position
+        for position, node in enumerate(postorder):
+            self._post[node] = position
+
+        # - every out-neighbour finishes first ( DAG ) , so one pass in post-order settles `low`
+        self._low: array = array('q', self._post)
+        for node in postorder:
+            for neighbour in graph[node]:
+                if self._low[neighbour] < self._low[node]:
+                    self._low[node] = self._low[neighbour]
+        # - children finish before their parent , so one pass in post-order settles `tree_low` too
+        self._tree_low: array = array('q', self._post)
+        for node in postorder:
+            parent: int = forest.parent[node]
+            if parent >= 0 and self._tree_low[node] < self._tree_low[parent]:
+                self._tree_low[parent] = self._tree_low[node]
+
+        self._closure: Optional[List[bytes]] = None
+        if closure if closure is not None else node_count <= CLOSURE_LIMIT:
+            self._closure = self._closure_rows(graph, order)
+
+    def _closure_rows(self, graph: AdjacencyView[Node], order: List[Node]) -> List[bytes]:
+        """closure bitset of every node , relative to it's own rank"""
+        rank: array = self._rank
+        bits: List[int] = [0] * len(order)
+        rows: List[bytes] = [b''] * len(order)
+        for node in reversed(order):
+            row: int = 1
+            for neighbour in graph[node]:
+                row |= bits[neighbour] << (rank[neighbour] - rank[node])
+            bits[node] = row
+            rows[node] = row.to_bytes((row.bit_length() + 7) // 8, 'little')
+        return rows
+
+    def reachable(self, u: Node, v: Node) -> bool:
+        """checks if there is a path from `u` to `v` ( a node reaches itself )"""
+        if u == v:
+            return True
+        if self._rank[u] > self._rank[v]:
+            return False
+        post_v: int = self._post[v]
+        if not self._low[u] <= post_v <= self._post[u]:
+            return False
+        if self._tree_low[u] <= post_v:
+            return True
+        if self._closure is not None:
+            shift: int = self._rank[v] - self._rank[u]
+            row: bytes = self._closure[u]
+            return (shift >> 3) < len(row) and bool(row[shift >> 3] >> (shift & 7) & 1)
+        return self._search(u, v)
+
+    def _search(self, u: Node, v: Node) -> bool:
+        """pruned DFS , for what the labels alone can't decide"""
+        rank, post, low, tree_low = self._rank, self._post, self._low, self._tree_low
+        rank_v, post_v = rank[v], post[v]
+        seen: Set[Node] = {u}
+        stack: List[Node] = [u]
+        while stack:
+            node: Node = stack.pop()
+            for neighbour in self._graph[node]:
+                if neighbour in seen or rank[neighbour] > rank_v or not low[neighbour] <= post_v <= post[neighbour]:
+                    continue
+                if tree_low[neighbour] <= post_v:
+                    return True
+                seen.add(neighbour)
+                stack.append(neighbour)
+        return False
+
+    @property
+    def nbytes(self) -> int:
+        """size of the index ( labels + closure rows ) , in bytes"""
+        size: int = sum(len(labels) * labels.itemsize for labels in (self._rank, self._post, self._low, self._tree_low))
+        if self._closure is not None:
+            size += sum(len(row) for row in self._closure)
+        return size
+
+    def __len__(self) -> int:
+        return len(self._rank)
+
+
+# Testing Entrypoint
+# ------------------
+if __name__ == '__main__':
+    import random
+    import time
+    from sorting.topological_sort.kahn_algorithm_topological_sort import graph
+    from traversal.bfs import traverse as bfs_traverse
+    from generators import random_dag_csr
+
+    for closure in (True, False):
+        index: ReachabilityIndex = ReachabilityIndex(graph, closure=closure)
+        assert [[index.reachable(u, v) for v in graph] for u in graph] == [[bfs_traverse(graph, u).level[v] >= 0 for v in graph] for u in graph]
+    try:
+        ReachabilityIndex({0: [1], 1: [0]})
+        cycle_detected: bool = False
+    except Exception:
+        cycle_detected = True
+    assert cycle_detected
+
+    # Benchmark
+    # - build time , index size , and query time against a BFS per query
+    print(f"\n{'DAG Reachability Index':^88}")
+    print("+", "-" * 84, "+")
+    print(f"| {'nodes':>8} | {'edges':>9} | {'closure':>7} | {'build (s)':>9} | {'size (KiB)':>10} | {'query (us)':>10} | {'bfs query (us)':>14} |")
+    print("+", "-" * 84, "+")
+    for node_count, average_degree, closure in ((5_000, 3, True), (5_000, 3, False), (100_000, 3, False)):
+        dag = random_dag_csr(node_count, average_degree, seed=11)
+        started: float = time.perf_counter()
+        index = ReachabilityIndex(dag, closure=closure)
+        build_seconds: float = time.perf_counter() - started
+
+        # - every answer from a few sources , checked against plain BFS
+        rng: random.Random = random.Random(11)
+        bfs_seconds: float = 0.0
+        sources: List[Node] = rng.sample(range(node_count), 20)
+        for source in sources:
+            started = time.perf_counter()
+            level: List[int] = bfs_traverse(dag, source).level
+            bfs_seconds += time.perf_counter() - started
+            assert [index.reachable(source, v) for v in range(node_count)] == [hops >= 0 for hops in level]
+
+        pairs: List[Tuple[Node, Node]] = [(rng.randrange(node_count), rng.randrange(node_count)) for _ in range(100_000)]
+        started = time.perf_counter()
+        for u, v in pairs:
+            index.reachable(u, v)
+        query_seconds: float = time.perf_counter() - started
+        print(f"| {node_count:>8,} | {dag.edge_count:>9,} | {str(closure):>7} | {build_seconds:>9.2f} | {index.nbytes / 1024:>10,.0f} | {query_seconds / len(pairs) * 1e6:>10.2f} | {bfs_seconds / len(sources) * 1e6:>14,.0f} |")
+    print("+", "-" * 84, "+")
@@ -0,0 +1,262 @@
+"""
+Node Reordering ( Relabeling for Locality )
+===========================================
+
+> _neighbours that are visited together , shall live together_
+
+- node ids usually follow insertion order , which has nothing to do with the shape of the graph
+- so a traversal keeps jumping all over the `targets` / distance / visited arrays , and most reads miss the cache
+- relabeling nodes such that connected nodes get nearby ids , keeps those reads close to each other
+
+Strategies :
+
+- `bfs_order`               : ids in BFS visiting order ( component by component )
+- `reverse_cuthill_mckee`   : BFS from a low degree node , neighbours taken lowest degree first , whole order reversed
+                              - the classic bandwidth reduction ordering , treats edges as un-directed
+- `degree_order`            : highest out-degree first , keeps the hot hub nodes together
+
+- every strategy returns an order ( `order[new_id] = old_id` ) , `relabel` applies it
+    - and returns a `Permutation` for translating results back to the original ids
+
+python3 -m reordering
+"""
+from typing import *
+from collections import deque
+from array import array
+
+from graph_representation import AdjacencyView, Graph, CSR, RepresentationOption, Types, UnweightedView
+
+# - a node ( vertex ) type
+Node = Types.Node
+
+
+class Permutation(NamedTuple):
+    """
+    Relabeling of nodes
+        - `new_to_old[new_id]` : original id of a relabeled node
+        - `old_to_new[old_id]` : relabeled id of an original node
+    """
+    new_to_old: List[Node]
+    old_to_new: List[Node]
+
+    @classmethod
+    def from_order(cls, order: Sequence[Node]) -> 'Permutation':
+        old_to_new: List[Node] = [0] * len(order)
+        for new_id, old_id in enumerate(order):
+            old_to_new[old_id] = new_id
+        return cls(list(order), old_to_new)
+
+    def nodes_to_old(self, nodes: Iterable[Node]) -> List[Node]:
+        """translates relabeled node ids ( e.g a traversal order / path ) back"""
+        return [self.new_to_old[node] for node in nodes]
+
+    def values_to_old(self, values: Union[Sequence, Dict[Node, Any]]) -> Union[list, Dict[Node, Any]]:
+        """translates per-node results ( e.g distances ) , indexed by relabeled ids , back"""
+        if isinstance(values, dict):
+            return {self.new_to_old[node]: value for node, value in values.items()}
+        translated: list = [None] * len(values)
+        for new_id, value in enumerate(values):
+            translated[self.new_to_old[new_id]] = value
+        return translated
+
+
+# ---
+# Strategies
+# ---
+
+def bfs_order(graph: AdjacencyView[Node]) -> List[Node]:
+    """BFS visiting order , starting a fresh BFS from the lowest unvisited id for every component"""
+    node_count: int = len(graph)
+    visited: bytearray = bytearray(node_count)
+    order: List[Node] = []
+    for start in range(node_count):
+        if visited[start]:
+            continue
+        visited[start] = 1
+        to_visit: deque = deque([start])
+        while to_visit:
+            node: Node = to_visit.popleft()
+            order.append(node)
+            for neighbour in graph[node]:
+                if not visited[neighbour]:
+                    visited[neighbour] = 1
+                    to_visit.append(neighbour)
+    return order
+
+
+def reverse_cuthill_mckee(graph: AdjacencyView[Node]) -> List[Node]:
+    """
+    Reverse Cuthill-McKee order
+        - edges are taken as un-directed ( out + in neighbours )
+        - every component starts from it's lowest degree node
+    """
+    node_count: int = len(graph)
+    # - un-directed neighbours
+    undirected: List[List[Node]] = [[] for _ in range(node_count)]
+    for node in range(node_count):
+        for neighbour in graph[node]:
+            if neighbour != node:
+                undirected[node].append(neighbour)
+                undirected[neighbour].append(node)
+    degree: List[int] = [len(neighbours) for neighbours in undirected]
+
+    visited: bytearray = bytearray(node_count)
+    order: List[Node] = []
+    for start in sorted(range(node_count), key=degree.__getitem__):
+        if visited[start]:
+            continue
+        visited[start] = 1
+        to_visit: deque = deque([start])
+        while to_visit:
+            node: Node = to_visit.popleft()
+            order.append(node)
+            fresh: List[Node] = [neighbour for neighbour in set(undirected[node]) if not visited[neighbour]]
+            fresh.sort(key=degree.__getitem__)
+            for neighbour in fresh:
+                visited[neighbour] = 1
+                to_visit.append(neighbour)
+    order.reverse()
+    return order
+
+
+def degree_order(graph: AdjacencyView[Node]) -> List[Node]:
+    """highest out-degree first ( ties keep their original order )"""
+    return sorted(range(len(graph)), key=lambda node: -len(graph[node]))
+
+
+# ---
+# Relabeling
+# ---
+
+def relabel(graph: Union[Graph, CSR, Dict], order: Sequence[Node], weighted: bool = False) -> Tuple[Union[Graph, CSR, Dict], Permutation]:
+    """
+    applies an order ( `order[new_id] = old_id` ) to a graph
+        - returns the relabeled graph ( same representation as given ) and the `Permutation`
+        - neighbour lists of the relabeled graph are sorted by id
+        - `weighted` : neighbours are `( neighbour_node, edge_weight )` tuples ( a `CSR` knows it by itself )
+
+    NOTE:
+        - nodes must be named `0 .. n-1`
+    """
+    if len(order) != len(graph):
+        raise Exception(f'order covers {len(order)} nodes , but graph has {len(graph)}')
+    permutation: Permutation = Permutation.from_order(order)
+    old_to_new: List[Node] = permutation.old_to_new
+
+    if isinstance(graph, CSR):
+        offsets: array = array('q', [0])
+        targets: array = array('q')
+        weights: Optional[array] = array(graph.weights.typecode) if graph.weights is not None else None
+        for old_id in order:
+            start, end = graph.offsets[old_id], graph.offsets[old_id + 1]
+            if weights is None:
+                targets.extend(sorted(old_to_new[target] for target in graph.targets[start:end]))
+            else:
+                for target, weight in sorted((old_to_new[graph.targets[i]], graph.weights[i]) for i in range(start, end)):
+                    targets.append(target)
+                    weights.append(weight)
+            offsets.append(len(targets))
+        return CSR(offsets, targets, weights), permutation
+
+    if weighted:
+        adjacency: Dict[Node, list] = {
+            new_id: sorted((old_to_new[neighbour], weight) for neighbour, weight in graph[old_id])
+            for new_id, old_id in enumerate(order)
+        }
+    else:
+        adjacency: Dict[Node, list] = {
+            new_id: sorted(old_to_new[neighbour] for neighbour in graph[old_id])
+            for new_id, old_id in enumerate(order)
+        }
+
+    if not hasattr(graph, 'adjacency_list'):
+        return adjacency, permutation
+
+    # - `Graph` ( or a snapshot of it ) , rebuild the representations it holds
+    relabeled: Graph = Graph()
+    representations: List[RepresentationOption] = [RepresentationOption.ADJACENCY_LIST]
+    if len(graph.adjacency_matrix):
+        representations.append(RepresentationOption.ADJACENCY_MATRIX)
+    for representation in representations:
+        for new_id in range(len(order)):
+            relabeled.add_node(new_id, to_representation=representation)
+        for new_id, neighbours in adjacency.items():
+            for neighbour in neighbours:
+                relabeled.add_edge((new_id, neighbour), to_representation=representation)
+    for _from, _to, *_ in graph.edge_list:
+        relabeled.add_edge((old_to_new[_from], old_to_new[_to]), to_representation=RepresentationOption.EDGE_LIST)
+    return relabeled, permutation
+
+
+def bandwidth(graph: AdjacencyView[Node]) -> float:
+    """average id gap `| u - v |` over all edges , lower means better locality"""
+    total, edges = 0, 0
+    for node in graph:
+        for neighbour in graph[node]:
+            total += abs(node - neighbour)
+            edges += 1
+    return total / edges if edges else 0.0
+
+
+# Testing Entrypoint
+# ------------------
+if __name__ == '__main__':
+    import random
+    import time
+    from traversal.bfs import bfs
+    from shortest_path.dijkstra import path
+
+    # - a grid ( road-network like ) graph , with node ids shuffled
+    #       - i.e the insertion order has no relation with the structure
+    side: int = 120
+    rng: random.Random = random.Random(7)
+    shuffled: List[Node] = list(range(side * side))
+    rng.shuffle(shuffled)
+    weighted_graph: Dict[Node, List[Tuple[Node, int]]] = {node: [] for node in range(side * side)}
+    for row in range(side):
+        for column in range(side):
+            node: Node = shuffled[row * side + column]
+            for d_row, d_column in ((0, 1), (1, 0), (0, -1), (-1, 0)):
+                if 0 <= row + d_row < side and 0 <= column + d_column < side:
+                    weighted_graph[node].append((shuffled[(row + d_row) * side + column + d_column], rng.randint(1, 9)))
+    weighted_csr: CSR = CSR.from_adjacency(weighted_graph, weighted=True)
+    csr: CSR = CSR.from_adjacency(UnweightedView(weighted_graph))
+
+    source: Node = shuffled[0]
+    expected_distances: Dict[Node, int] = path(weighted_csr, source)
+
+    def timed(function: Callable, *args) -> Tuple[float, Any]:
+        started: float = time.perf_counter()
+        result: Any = function(*args)
+        return time.perf_counter() - started, result
+
+    print(f"\n{'Relabeling Benchmark':^72}")
+    print("+", "-" * 68, "+")
+    print(f"| {'order':<22} | {'bandwidth':>10} | {'bfs (s)':>12} | {'dijkstra (s)':>14} |")
+    print("+", "-" * 68, "+")
+    for name, strategy in (('insertion ( shuffled )', None), ('bfs', bfs_order), ('reverse cuthill-mckee', reverse_cuthill_mckee), ('degree', degree_order)):
+        if strategy is None:
+            unweighted, weighted, permutation = csr, weighted_csr, Permutation.from_order(list(range(len(csr))))
+        else:
+            order: List[Node] = strategy(csr)
+            unweighted, permutation = relabel(csr, order)
+            weighted, _ = relabel(weighted_csr, order)
+        new_source: Node = permutation.old_to_new[source]
+        bfs_seconds, traversal = timed(bfs, unweighted, new_source)
+        dijkstra_seconds, distances = timed(path, weighted, new_source)
+
+        # - results translate back to the original ids
+        assert permutation.values_to_old(distances) == expected_distances
+        assert sorted(permutation.nodes_to_old(int(node) for node in traversal.split(' -> '))) == list(range(len(csr)))
+        print(f"| {name:<22} | {bandwidth(unweighted):>10.1f} | {bfs_seconds:>12.4f} | {dijkstra_seconds:>14.4f} |")
+    print("+", "-" * 68, "+")
+
+    # - `Graph` in , `Graph` out
+    graph: Graph = Graph()
+    for node in range(4):
+        graph.add_node(node)
+    for edge in [(0, 3), (3, 1), (1, 2)]:
+        graph.add_edge(edge)
+    relabeled, permutation = relabel(graph, bfs_order(graph))
+    assert dict(relabeled.adjacency_list) == {0: [1], 1: [2], 2: [3], 3: []}
+    assert permutation.nodes_to_old([0, 1, 2, 3]) == [0, 3, 1, 2]
@@ -0,0 +1,232 @@
+"""
+Result Cache
+============
+
+> _same query , same graph version => same answer_
+
+- graph algorithms ( bfs , topological sort , dijkstra ... ) are pure functions of the graph and their parameters
+- so once a result is computed , it can be served again for as long as the graph has not changed
+- `Graph.version` is bumped on every mutation , hence a result is stored against
+    - ( algorithm , parameters , graph , graph version )
+- a lookup for a newer version can never hit an older result , so stale results are never served
+
+KeyPoints :
+
+- LRU eviction , bounded by entry count and ( optionally ) by approx. result size in bytes
+- results of older versions of a graph are dropped as soon as the cache sees that graph at a newer version
+- a `GraphSnapshot` shares entries with it's origin graph at the same version
+- cached results are shared between callers , treat them as read-only
+- on a miss for a live `Graph` , the algorithm runs on a snapshot pinned at the version it's stored against ,
+    so a writer mutating the graph meanwhile can't leak a newer answer into an older version's entry
+- parameters are part of the key , un-hashable ones ( lists , dicts ... ) are computed every time , never cached
+
+python3 -m result_cache
+"""
+from typing import *
+from collections import OrderedDict
+import sys
+import threading
+import weakref
+
+from graph_representation import Graph, GraphSnapshot, CSR
+
+
+def estimate_size(result: Any) -> int:
+    """approx. size ( in bytes ) of a result , counting one level of nesting"""
+    size: int = sys.getsizeof(result)
+    if isinstance(result, dict):
+        size += sum(sys.getsizeof(key) + sys.getsizeof(value) for key, value in result.items())
+    elif isinstance(result, (list, tuple, set, frozenset)):
+        size += sum(sys.getsizeof(item) for item in result)
+    return size
+
+
+class ResultCache:
+    """
+    Graph Algorithm Result Cache
+    [Thread Safe]
+    """
+    def __init__(self, max_entries: int = 128, max_size: Optional[int] = None, size_of: Callable[[Any], int] = estimate_size):
+        """constructor"""
+        self._max_entries = max_entries
+        self._max_size = max_size           # in bytes , `None` for no limit
+        self._size_of = size_of
+        self._entries: OrderedDict[tuple, Tuple[Any, int]] = OrderedDict()   # key -> ( result, size ) , oldest first
+        self._keys_by_graph: Dict[int, Set[tuple]] = {}                      # id(graph) -> keys stored for it
+        self._latest_version: Dict[int, int] = {}                            # id(graph) -> newest version seen
+        self._size: int = 0
+        self._hits: int = 0
+        self._misses: int = 0
+        self._lock = threading.RLock()    # re-entrant , a graph may get garbage collected ( `_forget` ) while the lock is held
+
+    @staticmethod
+    def _identify(graph: Union[Graph, GraphSnapshot, CSR]) -> Tuple[Any, int]:
+        """( owner , version ) the results of a graph are stored against"""
+        version: Optional[int] = getattr(graph, 'version', None)
+        if version is None:
+            raise Exception(f'ERROR:UNVERSIONED-GRAPH - `{type(graph).__name__}` has no `version` , only `Graph` / `GraphSnapshot` / `CSR` results can be cached')
+        owner = graph.origin if isinstance(graph, GraphSnapshot) else graph
+        return owner, version
+
+    def get_or_compute(self, algorithm: Callable, graph: Union[Graph, GraphSnapshot, CSR], *params, **keyword_params) -> Any:
+        """
+        serves `algorithm(graph, *params, **keyword_params)` from cache , computing it on a miss
+        """
+        owner, version = self._identify(graph)
+        owner_id: int = id(owner)
+        key: tuple = (algorithm, owner_id, version, params, tuple(sorted(keyword_params.items())))
+        try:
+            hash(key)
+        except TypeError:
+            return algorithm(graph, *params, **keyword_params)
+
+        with self._lock:
+            if version > self._latest_version.get(owner_id, -1):
+                self._invalidate(owner, version)
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return self._entries[key][0]
+            self._misses += 1
+
+        if isinstance(graph, Graph):
+            # - the writer may move on while the algorithm runs , pin the version the result is stored against
+            graph = graph.snapshot()
+            if graph.version != version:
+                version = graph.version
+                key = (algorithm, owner_id, version) + key[3:]
+
+        # - compute outside the lock , so that other queries are not blocked meanwhile
+        result: Any = algorithm(graph, *params, **keyword_params)
+
+        with self._lock:
+            if version > self._latest_version.get(owner_id, -1):
+                # - the snapshot we computed on is newer than anything seen so far , older entries are stale
+                self._invalidate(owner, version)
+            if key not in self._entries and version >= self._latest_version.get(owner_id, -1):
+                size: int = self._size_of(result)
+                self._entries[key] = (result, size)
+                self._keys_by_graph[owner_id].add(key)
+                self._size += size
+                self._evict()
+        return result
+
+    def wrap(self, algorithm: Callable) -> Callable:
+        """cached version of an algorithm , same signature"""
+        def cached_algorithm(graph, *params, **keyword_params):
+            return self.get_or_compute(algorithm, graph, *params, **keyword_params)
+        cached_algorithm.__name__ = getattr(algorithm, '__name__', 'cached_algorithm')
+        cached_algorithm.__doc__ = getattr(algorithm, '__doc__', None)
+        return cached_algorithm
+
+    def _invalidate(self, owner: Any, version: int) -> None:
+        """graph has moved on to `version` , drop everything stored for it's older versions"""
+        owner_id: int = id(owner)
+        if owner_id not in self._latest_version:
+            self._keys_by_graph[owner_id] = set()
+            # - ids get reused once a graph is garbage collected , so forget it with the graph
+            weakref.finalize(owner, self._forget, owner_id)
+        self._latest_version[owner_id] = version
+        for key in [key for key in self._keys_by_graph[owner_id] if key[2] < version]:
+            self._remove(key)
+
+    def _forget(self, owner_id: int) -> None:
+        """graph is gone , drop everything stored for it"""
+        with self._lock:
+            for key in list(self._keys_by_graph.get(owner_id, ())):
+                self._remove(key)
+            self._keys_by_graph.pop(owner_id, None)
+            self._latest_version.pop(owner_id, None)
+
+    def _remove(self, key: tuple) -> None:
+        _, size = self._entries.pop(key)
+        self._keys_by_graph[key[1]].discard(key)
+        self._size -= size
+
+    def _evict(self) -> None:
+        """drops least recently used entries until within limits"""
+        while self._entries and (
+            len(self._entries) > self._max_entries
+            or (self._max_size is not None and self._size > self._max_size)
+        ):
+            self._remove(next(iter(self._entries)))
+
+    def clear(self) -> None:
+        with self._lock:
+            for key in list(self._entries):
+                self._remove(key)
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """hits , misses , entries & approx. size ( in bytes )"""
+        with self._lock:
+            return {'hits': self._hits, 'misses': self._misses, 'entries': len(self._entries), 'size': self._size}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Testing Entrypoint
+# ------------------
+if __name__ == '__main__':
+    from traversal.bfs import bfs
+    from sorting.topological_sort.kahn_algorithm_topological_sort import topological_sort_v2
+
+    graph: Graph = Graph()
+    for node in range(5):
+        graph.add_node(node)
+    for edge in [(0, 1), (0, 2), (1, 2), (1, 3), (2, 4), (3, 2), (3, 4)]:
+        graph.add_edge(edge)
+
+    cache: ResultCache = ResultCache(max_entries=4)
+    cached_bfs = cache.wrap(bfs)
+
+    # - repeated queries are served from cache
+    assert cached_bfs(graph, 0) == "0 -> 1 -> 2 -> 3 -> 4"
+    assert cached_bfs(graph, 0) == "0 -> 1 -> 2 -> 3 -> 4"
+    assert cache.get_or_compute(topological_sort_v2, graph) == cache.get_or_compute(topological_sort_v2, graph)
+    assert cache.stats['hits'] == 2 and cache.stats['misses'] == 2
+
+    # - a snapshot at the same version shares the entries
+    snapshot: GraphSnapshot = graph.snapshot()
+    assert cached_bfs(snapshot, 0) == "0 -> 1 -> 2 -> 3 -> 4"
+    assert cache.stats['hits'] == 3
+
+    # - a mutation invalidates , stale results are never served
+    graph.add_node(5)
+    graph.add_edge((4, 5))
+    assert cached_bfs(graph, 0) == "0 -> 1 -> 2 -> 3 -> 4 -> 5"
+    assert len(cache) == 1
+
+    # - a writer mutating the graph while the algorithm runs , the result still matches the version it's stored against
+    def bfs_racing_a_writer(graph, source):
+        live.add_edge((1, 2))
+        return bfs(graph, source)
+
+    live: Graph = Graph()
+    for node in range(3):
+        live.add_node(node)
+    live.add_edge((0, 1))
+    pinned: GraphSnapshot = live.snapshot()
+    assert cache.get_or_compute(bfs_racing_a_writer, live, 0) == "0 -> 1"
+    assert cache.get_or_compute(bfs_racing_a_writer, pinned, 0) == bfs(pinned, 0) == "0 -> 1"
+
+    # - a miss pinned at a newer version than the cache has seen drops the graph's older entries
+    cache.get_or_compute(bfs, live, 0)
+    assert any(key[1] == id(live) for key in cache._entries)
+    #       - the writer gets in between the version lookup & the snapshot
+    live.snapshot = lambda: (live.add_edge((2, 0)), Graph.snapshot(live))[1]
+    assert cache.get_or_compute(bfs, live, 1) == "1 -> 2 -> 0"
+    del live.snapshot
+    assert [key[2] for key in cache._entries if key[1] == id(live)] == [live.version]
+
+    # - un-hashable parameters are computed , not cached
+    entries: int = len(cache)
+    assert cache.get_or_compute(lambda graph, sources: [bfs(graph, source) for source in sources], graph, [0, 4]) == [cached_bfs(graph, 0), "4 -> 5"]
+    assert len(cache) == entries
+
+    # - LRU eviction
+    for source in range(6):
+        cached_bfs(graph, source)
+    assert len(cache) == 4
+    print(cache.stats)
@@ -175,6 +175,7 @@ GRAPH_REPRESENTATION = """
 # Imports
 
 from typing import *
+from graph_representation import AdjacencyView, CSR
 
 # Custom Types
 
@@ -191,7 +192,8 @@ EdgeWeight = NewType('EdgeWeight', Weight)
 PathCost = NewType('PathCost', Weight)
 
 # - a graph type
-Graph = NewType('Graph', Dict[Node, Set[Tuple[Node, EdgeWeight]]]) # Weighted Adjacency List
+#       - any representation following the neighbour access protocol ( dict / `CSR` ) , yielding `( neighbour_node, edge_weight )`
+Graph = AdjacencyView[Tuple[Node, EdgeWeight]] # Weighted Adjacency List
 
 # Graph ( in adjacency list repr )
 # 
@@ -244,17 +246,18 @@ NOTE : we can keep `existing-shortest-path-storage` as a hashmap or a matrix , w
 
 # ---
 
-def path(graph: Graph, source: Node) -> List[PathCost]:
+def path(graph: Graph, source: Node, verbose: bool = True) -> List[PathCost]:
     """
     Bellman-Ford-Moore Implementation
     ---------------------------------
+    - `verbose` : prints the distances after every relaxation ( as traced above )
     """
     # Steps
     # -----
 
     # Prepration
 
-    total_vertices: int = 6
+    total_vertices: int = len(graph)
     distance: Dict[Node, PathCost] = { v:float('inf') for v in graph}    # Weight here will signify the shortest distance to this node
     distance[source] = 0
 
@@ -264,7 +267,8 @@ def path(graph: Graph, source: Node) -> List[PathCost]:
 
     counter = 1
     while counter <= total_vertices - 1:
-        print(f'Iteration {counter}:')
+        if verbose:
+            print(f'Iteration {counter}:')
         for node in graph:
             u: Node = node
             neighbour_info: Set[Tuple[Node, EdgeWeight]] = graph[u]
@@ -275,7 +279,8 @@ def path(graph: Graph, source: Node) -> List[PathCost]:
                 if distance[v] > distance[u] + edge_weight:
                     new_cost: PathCost = distance[u] + edge_weight
                     distance[v] = new_cost
-                print(f"\t{[v for _, v in distance.items()]}")
+                if verbose:
+                    print(f"\t{[v for _, v in distance.items()]}")
         counter += 1
     # return results
     return distance
@@ -298,3 +303,7 @@ if __name__ == '__main__':
     expected_shortest_path = [0, 2, -1, -4, 4, -3]
     
     assert list(shortest_path.values()) == expected_shortest_path, f"{expected_shortest_path=} , but got : {list(shortest_path.values())}"
+
+    # - same algorithm , straight over a weighted CSR snapshot ( no conversion )
+    csr: CSR = CSR.from_adjacency(graph, weighted=True)
+    assert list(path(csr, source).values()) == expected_shortest_path
@@ -0,0 +1,179 @@
+"""
+DAG Shortest / Longest Path
+===========================
+
+> _This algorithm gives us the shortest ( or longest ) path from a `source` node to all the other nodes , when the graph has no cycle_
+
+- `Bellman-Ford` relaxes every edge `V - 1` times , because it doesn't know in which order the edges should be relaxed
+- in a DAG we do know : in topological order ( `topological_sort_v2` )
+    - by the time we reach a node , every edge coming into it has been relaxed already , so it's distance is final
+    - so every edge is relaxed exactly once => `O(V + E)`
+- negative weights are fine ( no cycle , so no negative cycle either )
+- the longest path is the same pass , relaxing upwards instead of downwards
+    - ( on a general graph it's NP-hard , on a DAG it's this easy )
+
+    DAG Shortest Path KeyPoints :
+
+    - It follows DP approach ( over the topological order )
+    - It returns the `distance` & `predecessor` of every node
+        - `predecessor[node]` : node before it on the best path ( `-1` for `source` & not reachable nodes )
+        - not reachable nodes are at `inf` ( shortest ) / `-inf` ( longest )
+
+    - Note
+        - we are using weighted adjacency list representation , yielding `( neighbour_node, edge_weight )`
+        - nodes must be named `0 .. n-1`
+        - raises , if the graph has a cycle
+
+Critical Path :
+
+- in a job DAG ( edge weight = time taken ) , the longest path from any node is the least time the whole job can take
+- `critical_path` starts every node at `0` , so the longest path may start anywhere
+
+python3 -m shortest_path.dag_shortest_path
+"""
+
+# Imports
+
+from typing import *
+from graph_representation import AdjacencyView, CSR, UnweightedView
+from sorting.topological_sort.kahn_algorithm_topological_sort import topological_sort_v2
+
+# Custom Types
+
+# - a node ( vertex ) type
+Node = NewType('Node', int)
+
+# - a weight/cost/priority type
+Weight = NewType('Weight', int)
+
+# - a weight/cost of edge type
+EdgeWeight = NewType('EdgeWeight', Weight)
+
+# - a cost of path type
+PathCost = NewType('PathCost', Weight)
+
+# - a graph type
+#       - any representation following the neighbour access protocol ( dict / `CSR` ) , yielding `( neighbour_node, edge_weight )`
+Graph = AdjacencyView[Tuple[Node, EdgeWeight]] # Weighted Adjacency List
+
+# Graph ( in adjacency list repr ) , same as `bellman_ford.graph` ( a DAG , with negative weights )
+graph: Graph = {    # Weighted Adjacency List
+    0: { (1, 2) , (2, -1) },
+    1: { (2, -3), (3, -6) },
+    2: { (4, 5) },
+    3: { (5, 1) },
+    4: { (5, 5), (3, 2) },
+    5: set()
+}
+
+
+class DAGPaths(NamedTuple):
+    distance: List[PathCost]
+    predecessor: List[int]
+
+
+def _relax(graph: Graph, order: List[Node], distance: List[PathCost], longest: bool) -> List[int]:
+    """relaxes every edge once , in topological order ( `distance` is updated in place )"""
+    predecessor: List[int] = [-1] * len(graph)
+    unreachable: float = float('-inf') if longest else float('inf')
+    for u in order:
+        if distance[u] == unreachable:
+            continue
+        for v, edge_weight in graph[u]:
+            new_cost: PathCost = distance[u] + edge_weight
+            if (new_cost > distance[v]) if longest else (new_cost < distance[v]):
+                distance[v] = new_cost
+                predecessor[v] = u
+    return predecessor
+
+
+def shortest_paths(graph: Graph, source: Node) -> DAGPaths:
+    """
+    DAG Shortest Path Implementation
+    --------------------------------
+    """
+    order: List[Node] = topological_sort_v2(UnweightedView(graph))
+    distance: List[PathCost] = [float('inf')] * len(graph)
+    distance[source] = 0
+    return DAGPaths(distance, _relax(graph, order, distance, longest=False))
+
+
+def longest_paths(graph: Graph, source: Node) -> DAGPaths:
+    """
+    DAG Longest Path Implementation
+    -------------------------------
+    """
+    order: List[Node] = topological_sort_v2(UnweightedView(graph))
+    distance: List[PathCost] = [float('-inf')] * len(graph)
+    distance[source] = 0
+    return DAGPaths(distance, _relax(graph, order, distance, longest=True))
+
+
+def path_to(paths: DAGPaths, target: Node) -> List[Node]:
+    """nodes of the best path to `target` , from where it starts ( empty if `target` is not reachable )"""
+    if paths.distance[target] in (float('inf'), float('-inf')):
+        return []
+    route: List[Node] = [target]
+    while paths.predecessor[route[-1]] >= 0:
+        route.append(paths.predecessor[route[-1]])
+    route.reverse()
+    return route
+
+
+def critical_path(graph: Graph) -> Tuple[PathCost, List[Node]]:
+    """
+    longest path of the whole DAG , starting anywhere : `( it's length, it's nodes )` , `( 0, [] )` if it's empty
+    """
+    if len(graph) == 0:
+        return 0, []
+    order: List[Node] = topological_sort_v2(UnweightedView(graph))
+    distance: List[PathCost] = [0] * len(graph)
+    paths: DAGPaths = DAGPaths(distance, _relax(graph, order, distance, longest=True))
+    end: Node = max(range(len(graph)), key=distance.__getitem__)
+    return distance[end], path_to(paths, end)
+
+
+# Testing Entrypoint
+# ------------------
+if __name__ == '__main__':
+    import time
+    from shortest_path import bellman_ford
+    from generators import random_dag_csr
+
+    source: Node = 0
+    shortest: DAGPaths = shortest_paths(graph, source)
+    expected_shortest_path = [0, 2, -1, -4, 4, -3]
+    assert shortest.distance == expected_shortest_path == list(bellman_ford.path(graph, source, verbose=False).values())
+    assert path_to(shortest, 5) == [0, 1, 3, 5]
+
+    longest: DAGPaths = longest_paths(graph, source)
+    assert longest.distance == [0, 2, -1, 6, 4, 9]
+    route: List[Node] = path_to(longest, 5)
+    assert route[0] == 0 and route[-2:] == [4, 5] and sum(dict(graph[u])[v] for u, v in zip(route, route[1:])) == 9
+    assert path_to(shortest_paths(graph, 3), 0) == [] and shortest_paths(graph, 3).distance[0] == float('inf')
+    assert critical_path(graph) == (10, [2, 4, 5])
+    assert critical_path({0: {(1, 3)}, 1: set(), 2: {(0, 1)}}) == (4, [2, 0, 1])
+    assert critical_path({}) == (0, [])
+
+    # - same , straight over a weighted CSR
+    csr: CSR = CSR.from_adjacency(graph, weighted=True)
+    assert shortest_paths(csr, source) == shortest
+
+    # Benchmark
+    # - same weighted DAGs , dag shortest path vs bellman-ford ( quiet )
+    print(f"\n{'DAG Shortest Path vs Bellman-Ford':^65}")
+    print("+", "-" * 61, "+")
+    print(f"| {'nodes':>7} | {'edges':>8} | {'bellman-ford (s)':>16} | {'dag (s)':>9} | {'speed-up':>9} |")
+    print("+", "-" * 61, "+")
+    for node_count, average_degree in ((300, 4), (1_000, 4)):
+        dag: CSR = random_dag_csr(node_count, average_degree, seed=45, max_weight=9)
+        source = topological_sort_v2(UnweightedView(dag))[0] # reaches most of the DAG
+        started: float = time.perf_counter()
+        expected: Dict[Node, PathCost] = bellman_ford.path(dag, source, verbose=False)
+        bellman_ford_seconds: float = time.perf_counter() - started
+        started = time.perf_counter()
+        result: DAGPaths = shortest_paths(dag, source)
+        dag_seconds: float = time.perf_counter() - started
+        assert result.distance == list(expected.values())
+        print(f"| {node_count:>7,} | {dag.edge_count:>8,} | {bellman_ford_seconds:>16.3f} | {dag_seconds:>9.4f} | {bellman_ford_seconds / dag_seconds:>8.0f}x |")
+    print("+", "-" * 61, "+")
@@ -139,6 +139,7 @@ GRAPH_REPRESENTATION = """
 
 # Imports
 from typing import *
+from graph_representation import AdjacencyView
 from queue import PriorityQueue
 
 # Custom Types
@@ -156,7 +157,8 @@ EdgeWeight = NewType('EdgeWeight', Weight)
 PathCost = NewType('PathCost', Weight)
 
 # - a graph type
-Graph = NewType('Graph', Dict[Node, Set[Tuple[Node, EdgeWeight]]]) # Weighted Adjacency List
+#       - any representation following the neighbour access protocol ( dict / `CSR` ) , yielding `( neighbour_node, edge_weight )`
+Graph = AdjacencyView[Tuple[Node, EdgeWeight]] # Weighted Adjacency List
 
 # Graph ( in adjacency list repr )
 # 
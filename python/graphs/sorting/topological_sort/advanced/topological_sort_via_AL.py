@@ -4,13 +4,14 @@ Topological Sort on adjacency list
 python3 -m sorting.topological_sort.advanced.topological_sort_via_AL
 """
 
-from graph_representation import Graph, RepresentationOption, Utilities, Types
+from graph_representation import AdjacencyView, Graph, RepresentationOption, Utilities, Types
 from typing import *
 
-def sort(graph: Graph) -> List[Types.Node]:
+def sort(graph: AdjacencyView[Types.Node]) -> List[Types.Node]:
 
     # get graph ( adjacancy list map )
-    _graph: Dict[Types.Node, List[Types.Node]] = graph.adjacency_list
+    #   - `Graph` , `CSR` and plain dicts all read the same way
+    _graph: AdjacencyView[Types.Node] = graph
     
     # + ------------------------ +
     # | Create In-degree mapping |
@@ -0,0 +1,169 @@
+"""
+DAG Executor ( Parallel Task Scheduling )
+
+- every node of a DAG is a task , an edge `u --> v` says `v` needs `u` done first
+- `topological_generations` tells which tasks *could* run together , but running it generation by generation
+    waits for the slowest task of every generation
+- instead , a task is handed to the pool the moment it's last predecessor finishes ( Kahn's in-degrees , on the fly )
+
+KeyPoints :
+
+- at most `max_workers` tasks are in flight , the rest wait in a ready queue ( FIFO )
+- a failed task doesn't stop the others , but everything depending on it is skipped
+    - `fail_fast=True` : nothing new is started after the first failure
+- every task is timed inside the worker , so the timing is the task's own , not it's wait in the queue
+- process pools need a picklable ( module level ) `task` , and picklable results
+
+python3 -m sorting.topological_sort.dag_executor
+"""
+from typing import *
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+import time
+
+from graph_representation import AdjacencyView, Types
+from sorting.topological_sort.kahn_algorithm_topological_sort import get_in_degree_map, topological_generations
+
+Node = Types.Node
+
+
+class TaskResult(NamedTuple):
+    """
+    - `value`   : what the task returned ( `None` if it failed )
+    - `error`   : what the task raised ( `None` if it succeeded )
+    - `started` : wall clock time ( `time.time()` ) it started at , `seconds` : how long it ran
+    """
+    node: Node
+    value: Any
+    error: Optional[BaseException]
+    started: float
+    seconds: float
+
+
+class ExecutionReport(NamedTuple):
+    """
+    - `results` : of every task that ran , in order of completion
+    - `skipped` : tasks that never ran ( a predecessor failed , or `fail_fast` stopped the run )
+    - `seconds` : wall clock time of the whole run
+    """
+    results: Dict[Node, TaskResult]
+    skipped: List[Node]
+    seconds: float
+
+    @property
+    def failed(self) -> Dict[Node, BaseException]:
+        return {node: result.error for node, result in self.results.items() if result.error is not None}
+
+    @property
+    def ok(self) -> bool:
+        return not self.skipped and not self.failed
+
+
+def _timed(task: Callable[[Node], Any], node: Node) -> TaskResult:
+    """runs inside the worker"""
+    started: float = time.time()
+    clock: float = time.perf_counter()
+    try:
+        value: Any = task(node)
+    except Exception as error:
+        return TaskResult(node, None, error, started, time.perf_counter() - clock)
+    return TaskResult(node, value, None, started, time.perf_counter() - clock)
+
+
+def execute(
+    graph: AdjacencyView[Node],
+    task: Callable[[Node], Any],
+    max_workers: int = 4,
+    use_processes: bool = False,
+    fail_fast: bool = False,
+) -> ExecutionReport:
+    """
+    runs `task(node)` for every node of `graph` , each as soon as all it's predecessors have succeeded
+
+    - raises , if the graph has a cycle ( before anything runs )
+    """
+    topological_generations(graph) # cycle check
+    in_degree_map: Dict[Node, int] = get_in_degree_map(graph)
+    ready: Deque[Node] = deque(node for node in graph if in_degree_map[node] == 0)
+    results: Dict[Node, TaskResult] = {}
+    running: Dict[Future, Node] = {}
+    pool_type = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+    stopped: bool = False
+    clock: float = time.perf_counter()
+
+    with pool_type(max_workers) as pool:
+        while ready or running:
+            while ready and len(running) < max_workers:
+                node: Node = ready.popleft()
+                running[pool.submit(_timed, task, node)] = node
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                node = running.pop(future)
+                try:
+                    result: TaskResult = future.result()
+                except Exception as error: # the pool itself failed ( e.g un-picklable task / result )
+                    result = TaskResult(node, None, error, time.time(), 0.0)
+                results[node] = result
+                if result.error is not None:
+                    if fail_fast:
+                        stopped = True
+                        ready.clear()
+                    continue
+                if stopped:
+                    continue
+                for neighbour in graph[node]:
+                    in_degree_map[neighbour] -= 1
+                    if in_degree_map[neighbour] == 0:
+                        ready.append(neighbour)
+
+    skipped: List[Node] = [node for node in graph if node not in results]
+    return ExecutionReport(results, skipped, time.perf_counter() - clock)
+
+
+# Testing Entrypoint
+# ------------------
+if __name__ == '__main__':
+    import math
+    from sorting.topological_sort.kahn_algorithm_topological_sort import graph
+
+    # - every task starts after all it's predecessors are done
+    report: ExecutionReport = execute(graph, lambda node: node * 10)
+    assert report.ok and {node: result.value for node, result in report.results.items()} == {n: n * 10 for n in graph}
+    for node in graph:
+        for neighbour in graph[node]:
+            first, then = report.results[node], report.results[neighbour]
+            assert first.started + first.seconds <= then.started + 1e-3
+
+    # - a failure skips it's descendants only
+    def fail_on_one(node: Node) -> Node:
+        if node == 1:
+            raise ValueError(node)
+        return node
+    report = execute({0: [1, 2], 1: [3], 2: [4], 3: [], 4: []}, fail_on_one)
+    assert list(report.failed) == [1] and report.skipped == [3] and set(report.results) == {0, 1, 2, 4}
+    report = execute({0: [1, 2], 1: [3], 2: [4], 3: [], 4: []}, fail_on_one, max_workers=1, fail_fast=True)
+    assert list(report.failed) == [1] and report.skipped == [2, 3, 4]
+
+    # - process pool
+    report = execute(graph, math.factorial, max_workers=2, use_processes=True)
+    assert report.results[4].value == 24
+
+    # Benchmark
+    # - 0.05s sleeping tasks , a wide & uneven DAG : 4 chains of 1 , 2 , 4 , 8 tasks joined by a final task
+    chains: Dict[Node, List[Node]] = {}
+    final: Node = 15
+    node: Node = 0
+    for length in (1, 2, 4, 8):
+        for step in range(length):
+            chains[node] = [node + 1] if step < length - 1 else [final]
+            node += 1
+    chains[final] = []
+    def sleep(node: Node) -> None:
+        time.sleep(0.05)
+    serial_seconds: float = 0.05 * len(chains)
+    generations: List[List[Node]] = topological_generations(chains)
+    report = execute(chains, sleep, max_workers=4)
+    assert report.ok
+    print(f"\n{len(chains)} tasks of 0.05s , {len(generations)} generations ( critical path {0.05 * len(generations):.2f}s )")
+    print(f"serial             : {serial_seconds:.2f}s")
+    print(f"executor ( 4 )     : {report.seconds:.2f}s , task time {sum(r.seconds for r in report.results.values()):.2f}s")
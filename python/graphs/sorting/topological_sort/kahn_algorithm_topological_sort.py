@@ -12,16 +12,18 @@ Hence , we named - Kahn's Algorithm .
 NOTE
     - we have represented nodes as integers
     - we have used adjacency list representation for representing a graph
+    - a graph with a cycle has no topological order ,
+        but it's condensation does ( see `strongly_connected_components.condensation` )
 
 Study Link
 
     - https://www.interviewcake.com/concept/python3/topological-sort
 """
-import copy
 from typing import NewType, Dict, Set, List
+from graph_representation import AdjacencyView, CSR
 
 Node = NewType('Node', int)
-Graph = NewType('Graph', Dict[Node, Set]) # Adjacency List
+Graph = AdjacencyView[Node] # Adjacency List ( dict / `Graph` / `CSR` )
 
 GRAPH_REPRESENTATION = """
 
@@ -98,7 +100,7 @@ def topological_sort(graph: Graph):
 
     in_degree_map: Dict[Node, int] = get_in_degree_map(graph)
     nodes_with_no_incomming_edge: List[Node] = get_nodes_with_in_degree_zero(graph, in_degree_map)
-    graph_copy: Graph = copy.deepcopy(graph)
+    graph_copy: Dict[Node, Set] = { node: graph[node] for node in graph } # only nodes are removed , so neighbours are shared
     topological_sorted_order = []
 
     # loop unitil no node with zero incoming edge is left
@@ -139,7 +141,42 @@ def topological_sort_v2(graph: Graph):
     else:
         raise Exception('Graph has a cycle! No topological ordering exists.')
 
+def topological_generations(graph: Graph) -> List[List[Node]]:
+    """
+    - same as v2 , but a round at a time
+        - a generation : all the nodes whose in-degree hits zero in the same round
+        - nodes of a generation don't depend on each other , so they can run concurrently
+    - flattened , it's a topological order
+    """
+    in_degree_map: Dict[Node, int] = get_in_degree_map(graph)
+    generation: List[Node] = get_nodes_with_in_degree_zero(graph, in_degree_map)
+    generations: List[List[Node]] = []
+    sorted_count: int = 0
+
+    while len(generation) > 0:
+
+        generations.append(generation)
+        sorted_count += len(generation)
+        next_generation: List[Node] = []
+        for in_degree_zero_node in generation:
+            for node in graph[in_degree_zero_node]:
+                in_degree_map[node] -= 1
+                if in_degree_map[node] == 0:
+                    next_generation.append(node)
+        generation = next_generation
+
+    if sorted_count == len(graph):
+        return generations
+    else:
+        raise Exception('Graph has a cycle! No topological ordering exists.')
+
 if __name__ == '__main__':
 
     print("topological_sort ( basic ) : ", topological_sort(graph))
-    print("topological_sort ( v2    ) : ", topological_sort_v2(graph))
\ No newline at end of file
+    print("topological_sort ( v2    ) : ", topological_sort_v2(graph))
+
+    # - same algorithm , straight over a CSR snapshot ( no conversion )
+    assert topological_sort_v2(CSR.from_adjacency(graph)) == topological_sort_v2(graph)
+    print("topological_generations    : ", topological_generations(graph))
+    assert topological_generations(graph) == [[0], [1], [3], [2], [4]]
+    assert topological_generations({0: [2], 1: [2], 2: [], 3: []}) == [[0, 1, 3], [2]]
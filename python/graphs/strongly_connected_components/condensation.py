@@ -0,0 +1,85 @@
+"""
+Condensation ( DAG of Strongly Connected Components )
+
+- Kahn's sort ( and everything built on it ) gives up on a graph with a cycle
+- but squeeze every strongly connected component into a single node , and what's left is always a DAG :
+    - a cycle between components would make them one component
+- so on the condensation , topological sort & DAG scheduling work again ,
+    with a component as the unit ( e.g nodes of a component run together , or in any order among themselves )
+
+KeyPoints :
+
+- component `i` of the condensation is `components[i]` , `component_of[node]` maps back
+- components are numbered in topological order ( `tarjan` / `kosaraju` both give it ) ,
+    so every condensation edge goes from a lower to a higher number
+- edges inside a component are dropped , parallel edges between two components are merged
+
+python3 -m strongly_connected_components.condensation
+"""
+from typing import *
+
+from graph_representation import AdjacencyView, CSR, Types
+from strongly_connected_components.tarjan import strongly_connected_components
+
+Node = Types.Node
+
+
+class Condensation(NamedTuple):
+    """
+    - `dag`          : condensation , nodes `0 .. k-1` are components
+    - `components`   : nodes of every component
+    - `component_of` : component of every node
+    """
+    dag: CSR
+    components: List[List[Node]]
+    component_of: Dict[Node, int]
+
+
+def condense(graph: AdjacencyView[Node], components: Optional[List[List[Node]]] = None) -> Condensation:
+    """
+    condensation of `graph`
+
+    - `components` : strongly connected components in topological order ( e.g `kosaraju.strongly_connected_components` ) ,
+                     found with `tarjan` when not given
+    """
+    if components is None:
+        components = strongly_connected_components(graph)
+    component_of: Dict[Node, int] = {node: index for index, component in enumerate(components) for node in component}
+    dag: Dict[int, Set[int]] = {index: set() for index in range(len(components))}
+    for node in graph:
+        source: int = component_of[node]
+        for neighbour in graph[node]:
+            target: int = component_of[neighbour]
+            if source != target:
+                dag[source].add(target)
+    return Condensation(CSR.from_adjacency(dag), components, component_of)
+
+
+# Testing Entrypoint
+# ------------------
+if __name__ == '__main__':
+    from sorting.topological_sort.kahn_algorithm_topological_sort import topological_sort_v2
+    from sorting.topological_sort.dag_executor import ExecutionReport, execute
+    from strongly_connected_components import kosaraju
+
+    # - build steps , with a dependency cycle `1 --> 2 --> 3 --> 1`
+    graph: Dict[Node, List[Node]] = {0: [1], 1: [2], 2: [3], 3: [1, 4], 4: [5], 5: [], 6: [4]}
+    try:
+        topological_sort_v2(graph)
+        cycle_detected: bool = False
+    except Exception:
+        cycle_detected = True
+    assert cycle_detected
+
+    condensation: Condensation = condense(graph)
+    assert [sorted(component) for component in condensation.components] == [[6], [0], [1, 2, 3], [4], [5]]
+    assert {node: list(condensation.dag[node]) for node in condensation.dag} == {0: [3], 1: [2], 2: [3], 3: [4], 4: []}
+    assert all(source < target for source in condensation.dag for target in condensation.dag[source])
+    assert condense(graph, kosaraju.strongly_connected_components(graph)).dag.targets == condensation.dag.targets
+
+    # - sort & schedule the components
+    order: List[int] = topological_sort_v2(condensation.dag)
+    position: Dict[int, int] = {component: index for index, component in enumerate(order)}
+    assert len(order) == 5 and all(position[source] < position[target] for source in condensation.dag for target in condensation.dag[source])
+    report: ExecutionReport = execute(condensation.dag, lambda component: sorted(condensation.components[component]))
+    assert report.ok and report.results[condensation.component_of[2]].value == [1, 2, 3]
@@ -0,0 +1,81 @@
+"""
+Strongly Connected Components ( using Kosaraju's Algorithm )
+
+- two DFS passes :
+    1. over the graph , note the finish order ( `traversal.dfs.traverse(...).postorder` )
+    2. over the *reversed* graph , roots taken by decreasing finish time :
+        every DFS tree of this pass is exactly one component
+- why : the node that finishes last is in a source component ,
+    and in the reversed graph , edges out of a source component point into it , so the tree can't leave it
+- `O(V + E)` , both passes use the iterative DFS engine , so no recursion limit
+
+KeyPoints :
+
+- components come out in topological order of the condensation ( sources first ) , same as `tarjan`
+- needs the reversed graph , built as a `CSR` ( `CSR.transpose()` ) , i.e an extra `O(V + E)` memory
+- the second pass lists every tree in one go ( it's preorder ) , a node with no parent starts the next component
+
+    - Note
+        - nodes must be named `0 .. n-1`
+
+python3 -m strongly_connected_components.kosaraju
+"""
+from typing import *
+
+from graph_representation import AdjacencyView, CSR, Types
+from traversal.dfs import DFSResult, traverse
+
+Node = Types.Node
+
+
+def strongly_connected_components(graph: AdjacencyView[Node], reverse: Optional[AdjacencyView[Node]] = None) -> List[List[Node]]:
+    """
+    strongly connected components of `graph` , in topological order of the condensation
+
+    - `reverse` : in-neighbours of every node ( e.g `CSR.transpose()` ) , built from `graph` when not given
+    """
+    if reverse is None:
+        reverse = (graph if isinstance(graph, CSR) else CSR.from_adjacency(graph)).transpose()
+    postorder: List[Node] = traverse(graph).postorder                       # 1.
+    second: DFSResult = traverse(reverse, reversed(postorder))              # 2.
+    components: List[List[Node]] = []
+    for node in second.preorder:
+        if second.parent[node] < 0:
+            components.append([])
+        components[-1].append(node)
+    return components
+
+
+# Testing Entrypoint
+# ------------------
+if __name__ == '__main__':
+    import time
+    from strongly_connected_components import tarjan
+    from generators import random_csr
+
+    graph: Dict[Node, List[Node]] = {0: [1], 1: [2], 2: [0, 3], 3: [4], 4: [5], 5: [3], 6: [5]}
+    assert [sorted(component) for component in strongly_connected_components(graph)] == [[6], [0, 1, 2], [3, 4, 5]]
+
+    # Benchmark
+    # - tarjan vs kosaraju , same components , every edge going to the same or a later component
+    print(f"\n{'Strongly Connected Components':^66}")
+    print("+", "-" * 62, "+")
+    print(f"| {'nodes':>9} | {'edges':>9} | {'components':>10} | {'tarjan (s)':>10} | {'kosaraju (s)':>12} |")
+    print("+", "-" * 62, "+")
+    for node_count, average_degree in ((200_000, 1), (200_000, 3)):
+        csr: CSR = random_csr(node_count, average_degree, seed=50)
+        results: List[List[List[Node]]] = []
+        timings: List[float] = []
+        for algorithm in (tarjan.strongly_connected_components, strongly_connected_components):
+            started: float = time.perf_counter()
+            results.append(algorithm(csr))
+            timings.append(time.perf_counter() - started)
+        assert sorted(map(sorted, results[0])) == sorted(map(sorted, results[1]))
+        for components in results:
+            label: List[int] = [0] * node_count
+            for index, component in enumerate(components):
+                for node in component:
+                    label[node] = index
+            assert all(label[node] <= label[neighbour] for node in csr for neighbour in csr[node])
+        print(f"| {node_count:>9,} | {csr.edge_count:>9,} | {len(results[0]):>10,} | {timings[0]:>10.2f} | {timings[1]:>12.2f} |")
+    print("+", "-" * 62, "+")
@@ -0,0 +1,86 @@
+"""
+Strongly Connected Components ( using Tarjan's Algorithm )
+
+- `u` & `v` are strongly connected , if `u` reaches `v` *and* `v` reaches `u`
+- that splits a directed graph in components ( SCCs ) , and every cycle lies inside one of them
+- a single DFS finds them all :
+    - `index[node]` : discovery order , `low[node]` : smallest index reachable from it's subtree ,
+        through nodes still on the component stack
+    - when a node finishes with `low == index` , it's the root of a component :
+        everything above it on the component stack is that component , popped in one go
+- `O(V + E)` , iterative ( the DFS stack holds `( node, iterator over it's neighbours )` ) , so no recursion limit
+
+KeyPoints :
+
+- Tarjan finds components sink first , they are returned reversed :
+    i.e in topological order of the condensation ( every edge goes to the same or a later component )
+- node names can be anything hashable ( dict / `Graph` / `CSR` / ... )
+
+python3 -m strongly_connected_components.tarjan
+"""
+from typing import *
+
+from graph_representation import AdjacencyView, Types
+
+Node = Types.Node
+
+
+def strongly_connected_components(graph: AdjacencyView[Node]) -> List[List[Node]]:
+    """
+    strongly connected components of `graph` , in topological order of the condensation
+    """
+    index: Dict[Node, int] = {}
+    low: Dict[Node, int] = {}
+    on_stack: Set[Node] = set()
+    stack: List[Node] = []
+    components: List[List[Node]] = []
+    for root in graph:
+        if root in index:
+            continue
+        index[root] = low[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+        work: List[Tuple[Node, Iterator[Node]]] = [(root, iter(graph[root]))]
+        while work:
+            node, neighbours = work[-1]
+            for neighbour in neighbours:
+                if neighbour not in index:
+                    # - go deeper , `node` stays open with it's iterator where it was left
+                    index[neighbour] = low[neighbour] = len(index)
+                    stack.append(neighbour)
+                    on_stack.add(neighbour)
+                    work.append((neighbour, iter(graph[neighbour])))
+                    break
+                if neighbour in on_stack and index[neighbour] < low[node]:
+                    low[node] = index[neighbour]
+            else:
+                # - all neighbours done , hand `low` up to the parent
+                work.pop()
+                if work and low[node] < low[work[-1][0]]:
+                    low[work[-1][0]] = low[node]
+                if low[node] == index[node]:
+                    component: List[Node] = []
+                    while True:
+                        member: Node = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+    components.reverse()
+    return components
+
+
+# Testing Entrypoint
+# ------------------
+if __name__ == '__main__':
+    from graph_representation import CSR
+
+    graph: Dict[Node, List[Node]] = {0: [1], 1: [2], 2: [0, 3], 3: [4], 4: [5], 5: [3], 6: [5]}
+    assert [sorted(component) for component in strongly_connected_components(graph)] == [[6], [0, 1, 2], [3, 4, 5]]
+    assert strongly_connected_components({}) == []
+
+    # - any node names , and no recursion limit
+    assert [sorted(component) for component in strongly_connected_components({'a': ['b'], 'b': ['a'], 'c': ['a']})] == [['c'], ['a', 'b']]
+    ring: CSR = CSR.from_adjacency({node: [(node + 1) % 100_000] for node in range(100_000)})
+    assert len(strongly_connected_components(ring)) == 1
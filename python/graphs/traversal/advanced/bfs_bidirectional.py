@@ -0,0 +1,140 @@
+"""
+BFS ( Bidirectional , Point to Point )
+
+- question : "is `t` reachable from `s` , and in how many hops ?"
+- a full BFS from `s` answers it , but explores the whole graph to do so
+- instead , grow two BFS balls at the same time
+    - forward from `s` ( over out-neighbours ) , backward from `t` ( over in-neighbours )
+    - stop as soon as they touch
+- with branching factor `b` and distance `d` , that's about `2 * b^(d/2)` nodes instead of `b^d`
+
+KeyPoints :
+
+- always grow the side whose frontier is smaller
+- a side grows one whole level at a time , and the best meeting point of that level is taken
+    ( the first touch is not always on a shortest path )
+- per query state is kept in dicts , so a query only costs what it explores
+
+python3 -m traversal.advanced.bfs_bidirectional
+"""
+from typing import *
+
+from graph_representation import AdjacencyView, CSR, Types
+
+Node = Types.Node
+
+
+class HopPath(NamedTuple):
+    """
+    - `hops` : edges on a shortest path ( `-1` if `target` is not reachable )
+    - `path` : nodes of one shortest path , `source` first ( empty if not reachable )
+    """
+    hops: int
+    path: List[Node]
+
+
+def _grow(
+    graph: AdjacencyView[Node],
+    frontier: List[Node],
+    parents: Dict[Node, Node],
+    depth: Dict[Node, int],
+    other_depth: Dict[Node, int],
+) -> Tuple[List[Node], Optional[Tuple[Node, Node]], int]:
+    """
+    grows one side by a level
+        - returns the next frontier , and the best `( node, neighbour )` edge reaching the other side , with it's total hops
+    """
+    next_frontier: List[Node] = []
+    best_edge: Optional[Tuple[Node, Node]] = None
+    best_hops: int = -1
+    for node in frontier:
+        for neighbour in graph[node]:
+            if neighbour in other_depth:
+                hops: int = depth[node] + 1 + other_depth[neighbour]
+                if best_edge is None or hops < best_hops:
+                    best_edge, best_hops = (node, neighbour), hops
+            if neighbour not in depth:
+                depth[neighbour] = depth[node] + 1
+                parents[neighbour] = node
+                next_frontier.append(neighbour)
+    return next_frontier, best_edge, best_hops
+
+
+def query(graph: AdjacencyView[Node], source: Node, target: Node, reverse: Optional[AdjacencyView[Node]] = None) -> HopPath:
+    """
+    shortest hop path from `source` to `target`
+
+    - `reverse` : in-neighbours of every node ( e.g `CSR.transpose()` )
+        - build it once and pass it in for repeated queries , it's built from `graph` otherwise
+        - for an un-directed graph , pass the graph itself
+    """
+    if source == target:
+        return HopPath(0, [source])
+    if reverse is None:
+        reverse = (graph if isinstance(graph, CSR) else CSR.from_adjacency(graph)).transpose()
+
+    forward_parent: Dict[Node, Node] = {}
+    backward_parent: Dict[Node, Node] = {} # next node towards `target`
+    forward_depth: Dict[Node, int] = {source: 0}
+    backward_depth: Dict[Node, int] = {target: 0}
+    forward_frontier: List[Node] = [source]
+    backward_frontier: List[Node] = [target]
+
+    while forward_frontier and backward_frontier:
+        if len(forward_frontier) <= len(backward_frontier):
+            forward_frontier, edge, hops = _grow(graph, forward_frontier, forward_parent, forward_depth, backward_depth)
+            if edge is not None:
+                meet_before, meet_after = edge
+                break
+        else:
+            backward_frontier, edge, hops = _grow(reverse, backward_frontier, backward_parent, backward_depth, forward_depth)
+            if edge is not None:
+                meet_after, meet_before = edge
+                break
+    else:
+        return HopPath(-1, [])
+
+    # - stitch the two halves , `source .. meet_before` + `meet_after .. target`
+    path: List[Node] = [meet_before]
+    while path[-1] != source:
+        path.append(forward_parent[path[-1]])
+    path.reverse()
+    path.append(meet_after)
+    while path[-1] != target:
+        path.append(backward_parent[path[-1]])
+    return HopPath(hops, path)
+
+
+# Testing Entrypoint
+# ------------------
+if __name__ == '__main__':
+    import random
+    import time
+    from traversal.bfs import graph, traverse
+    from generators import random_csr
+
+    assert query(graph, 0, 4) == HopPath(2, [0, 2, 4])
+    assert query(graph, 3, 0) == HopPath(-1, [])
+    assert query(graph, 1, 1) == HopPath(0, [1])
+
+    # Benchmark
+    # - query latency , against a full BFS from the source
+    csr: CSR = random_csr(200_000, 6, seed=9)
+    reverse: CSR = csr.transpose()
+    rng: random.Random = random.Random(9)
+    pairs: List[Tuple[Node, Node]] = [(rng.randrange(len(csr)), rng.randrange(len(csr))) for _ in range(20)]
+
+    full_seconds, bidirectional_seconds = 0.0, 0.0
+    for source, target in pairs:
+        started: float = time.perf_counter()
+        expected: int = traverse(csr, source).level[target]
+        full_seconds += time.perf_counter() - started
+        started = time.perf_counter()
+        result: HopPath = query(csr, source, target, reverse)
+        bidirectional_seconds += time.perf_counter() - started
+        assert result.hops == expected
+        assert len(result.path) == result.hops + 1 and all(b in csr[a] for a, b in zip(result.path, result.path[1:]))
+
+    print(f"\n{len(pairs)} queries , {csr.edge_count:,} edges")
+    print(f"full bfs      : {full_seconds / len(pairs) * 1000:8.2f} ms / query")
+    print(f"bidirectional : {bidirectional_seconds / len(pairs) * 1000:8.2f} ms / query")
@@ -0,0 +1,165 @@
+"""
+BFS ( Direction Optimizing : Top-Down / Bottom-Up )
+
+- classic ( top-down ) BFS : every frontier node checks all of it's out-neighbours
+    - in the middle levels of a low diameter graph , the frontier is huge
+        and most of those neighbours are already visited => wasted checks
+- bottom-up BFS : every *unvisited* node scans it's in-neighbours for one that is in the frontier
+    - stops at the first hit , so when the frontier is huge , most nodes find a parent in a check or two
+
+- so we go top-down while the frontier is small , bottom-up while it's large , and back again
+
+Switching Heuristic ( Beamer et al. ) :
+
+- top-down  => bottom-up : edges to check from the frontier ( `m_f` ) > edges of unvisited nodes ( `m_u` ) / `alpha`
+- bottom-up => top-down  : nodes in the frontier ( `n_f` ) < all nodes ( `n` ) / `beta`
+
+python3 -m traversal.advanced.bfs_direction_optimizing
+"""
+from typing import *
+
+from graph_representation import AdjacencyView, CSR, Types
+
+Node = Types.Node
+
+TOP_DOWN = "TOP_DOWN"
+BOTTOM_UP = "BOTTOM_UP"
+
+
+class DirectionOptimizedResult(NamedTuple):
+    """
+    - `order`, `level`, `parent` : same as `traversal.bfs.BFSResult`
+        - ( inside a bottom-up level , nodes come in id order )
+    - `directions[i]`  : direction used to discover level `i + 1`
+    - `edges_examined` : neighbours looked at , in total
+    """
+    order: List[Node]
+    level: List[int]
+    parent: List[int]
+    directions: List[str]
+    edges_examined: int
+
+
+def traverse(
+    graph: AdjacencyView[Node],
+    source: Node,
+    reverse: Optional[AdjacencyView[Node]] = None,
+    alpha: float = 14,
+    beta: float = 24,
+) -> DirectionOptimizedResult:
+    """
+    Direction Optimizing BFS
+    ------------------------
+    - `reverse` : in-neighbours of every node ( e.g `CSR.transpose()` ) ,
+                  built from `graph` when not given ( pass the graph itself for an un-directed graph )
+    - `alpha` , `beta` : switching thresholds ( see module notes ) ,
+                  a larger `alpha` switches to bottom-up sooner , a larger `beta` stays bottom-up longer
+
+    - Note
+        - nodes must be named `0 .. n-1`
+    """
+    node_count: int = len(graph)
+    if reverse is None:
+        reverse = (graph if isinstance(graph, CSR) else CSR.from_adjacency(graph)).transpose()
+    out_degree: List[int] = [len(graph[node]) for node in range(node_count)]
+
+    level: List[int] = [-1] * node_count
+    parent: List[int] = [-1] * node_count
+    level[source] = 0
+    order: List[Node] = [source]
+    frontier: List[Node] = [source]
+    in_frontier: bytearray = bytearray(node_count)
+    unvisited: List[Node] = [node for node in range(node_count) if node != source]
+    unexplored_edges: int = sum(out_degree) - out_degree[source]   # `m_u`
+    directions: List[str] = []
+    direction: str = TOP_DOWN
+    edges_examined: int = 0
+    depth: int = 0
+
+    while frontier:
+        depth += 1
+        frontier_edges: int = sum(out_degree[node] for node in frontier)   # `m_f`
+        if direction == TOP_DOWN and frontier_edges > unexplored_edges / alpha:
+            direction = BOTTOM_UP
+        elif direction == BOTTOM_UP and len(frontier) < node_count / beta:
+            direction = TOP_DOWN
+
+        next_frontier: List[Node] = []
+        if direction == TOP_DOWN:
+            # - every frontier node claims it's unvisited out-neighbours
+            for node in frontier:
+                neighbours = graph[node]
+                edges_examined += out_degree[node]
+                for neighbour in neighbours:
+                    if level[neighbour] < 0:
+                        level[neighbour] = depth
+                        parent[neighbour] = node
+                        next_frontier.append(neighbour)
+        else:
+            # - every unvisited node looks for a frontier node among it's in-neighbours
+            for node in frontier:
+                in_frontier[node] = 1
+            still_unvisited: List[Node] = []
+            for node in unvisited:
+                if level[node] >= 0:
+                    continue
+                for in_neighbour in reverse[node]:
+                    edges_examined += 1
+                    if in_frontier[in_neighbour]:
+                        level[node] = depth
+                        parent[node] = in_neighbour
+                        next_frontier.append(node)
+                        break
+                else:
+                    still_unvisited.append(node)
+            for node in frontier:
+                in_frontier[node] = 0
+            unvisited = still_unvisited
+
+        if not next_frontier:
+            break
+        directions.append(direction)
+        unexplored_edges -= sum(out_degree[node] for node in next_frontier)
+        order.extend(next_frontier)
+        frontier = next_frontier
+
+    return DirectionOptimizedResult(order, level, parent, directions, edges_examined)
+
+
+# Testing Entrypoint
+# ------------------
+if __name__ == '__main__':
+    import time
+    from traversal.bfs import graph, traverse as top_down_traverse
+    from generators import random_csr
+
+    # - always bottom-up / always top-down give the same levels as plain BFS
+    #       - `alpha = inf` switches to bottom-up on the first level , `beta = inf` never switches back
+    #       - `alpha = 1e-9` never switches to bottom-up
+    for alpha, beta, direction in ((float('inf'), float('inf'), BOTTOM_UP), (1e-9, float('inf'), TOP_DOWN)):
+        result: DirectionOptimizedResult = traverse(graph, 0, alpha=alpha, beta=beta)
+        assert set(result.directions) == {direction}
+        assert result.level == top_down_traverse(graph, 0).level
+        assert all(result.level[result.parent[node]] == result.level[node] - 1 for node in graph if result.parent[node] >= 0)
+
+    # Benchmark
+    # - a low diameter ( social-network like ) random graph
+    csr: CSR = random_csr(300_000, 16, seed=3)
+    reverse: CSR = csr.transpose()
+    started: float = time.perf_counter()
+    expected: List[int] = top_down_traverse(csr, 0).level
+    top_down_seconds: float = time.perf_counter() - started
+
+    print(f"\n{'Direction Optimizing BFS':^84}")
+    print(f"{csr.edge_count:,} edges , top-down only : {top_down_seconds:.2f}s , {csr.edge_count:,} edges examined\n")
+    print("+", "-" * 80, "+")
+    print(f"| {'alpha':>6} | {'beta':>6} | {'seconds':>8} | {'edges examined':>15} | {'directions per level':<32} |")
+    print("+", "-" * 80, "+")
+    for alpha, beta in ((14, 24), (4, 24), (14, 4), (50, 100)):
+        started = time.perf_counter()
+        result = traverse(csr, 0, reverse=reverse, alpha=alpha, beta=beta)
+        seconds: float = time.perf_counter() - started
+        assert result.level == expected
+        directions: str = ' '.join('T' if direction == TOP_DOWN else 'B' for direction in result.directions)
+        print(f"| {alpha:>6} | {beta:>6} | {seconds:>8.2f} | {result.edges_examined:>15,} | {directions:<32} |")
+    print("+", "-" * 80, "+")
@@ -0,0 +1,140 @@
+"""
+BFS ( Bit-Parallel Multi-Source )
+
+- we need hop distances from many sources , on the same graph
+- running `traversal.bfs.traverse` once per source scans every edge once per source
+- but BFS's from different sources keep meeting the same nodes , at roughly the same levels
+    - so let them share the scans
+
+Idea ( MS-BFS ) :
+
+- every node keeps a bitmask , bit `i` set => source `i` has reached it ( `seen` )
+- the frontier is a bitmask per node too ( `visit` ) : which sources reached it at the current level
+- one scan of a node's neighbours pushes *all* of it's sources at once :
+    - `visit_next[neighbour] |= visit[node]`
+- then only the bits a neighbour has not seen before are new :
+    - `new = visit_next[neighbour] & ~seen[neighbour]`
+
+- `batch_size` sources share one bitmask ( python ints have no fixed width , 64 mimics a machine word )
+
+python3 -m traversal.advanced.bfs_multi_source
+"""
+from typing import *
+
+from graph_representation import AdjacencyView, Types
+
+Node = Types.Node
+
+
+def _levels(graph: AdjacencyView[Node], sources: Sequence[Node]) -> Iterator[Tuple[int, Dict[Node, int]]]:
+    """
+    yields `( level, { node: mask of sources reaching it first at this level } )` , level by level
+        - bit `i` of a mask stands for `sources[i]`
+    """
+    seen: Dict[Node, int] = {}
+    visit: Dict[Node, int] = {}
+    for index, source in enumerate(sources):
+        seen[source] = seen.get(source, 0) | (1 << index)
+        visit[source] = seen[source]
+    level: int = 0
+    yield level, visit
+    while visit:
+        level += 1
+        # - one scan per node , for all it's sources
+        visit_next: Dict[Node, int] = {}
+        for node, mask in visit.items():
+            for neighbour in graph[node]:
+                visit_next[neighbour] = visit_next.get(neighbour, 0) | mask
+        # - keep only the bits seen for the first time
+        visit = {}
+        for node, mask in visit_next.items():
+            new: int = mask & ~seen.get(node, 0)
+            if new:
+                seen[node] = seen.get(node, 0) | new
+                visit[node] = new
+        if visit:
+            yield level, visit
+
+
+def _batches(sources: Sequence[Node], batch_size: int) -> Iterator[Sequence[Node]]:
+    for start in range(0, len(sources), batch_size):
+        yield sources[start:start + batch_size]
+
+
+def distances(graph: AdjacencyView[Node], sources: Sequence[Node], batch_size: int = 64) -> List[List[int]]:
+    """
+    distance matrix , `matrix[i][node]` : hops from `sources[i]` to `node` ( `-1` if not reachable )
+
+    - Note
+        - nodes must be named `0 .. n-1`
+    """
+    matrix: List[List[int]] = []
+    for batch in _batches(sources, batch_size):
+        rows: List[List[int]] = [[-1] * len(graph) for _ in batch]
+        for level, discovered in _levels(graph, batch):
+            for node, mask in discovered.items():
+                while mask:
+                    lowest: int = mask & -mask
+                    rows[lowest.bit_length() - 1][node] = level
+                    mask ^= lowest
+        matrix.extend(rows)
+    return matrix
+
+
+def eccentricities(graph: AdjacencyView[Node], sources: Sequence[Node], batch_size: int = 64) -> List[int]:
+    """
+    eccentricity of every source , i.e hops to the farthest node it can reach
+        - no per-node distances are stored , only one mask per level
+    """
+    result: List[int] = []
+    for batch in _batches(sources, batch_size):
+        eccentricity: List[int] = [0] * len(batch)
+        for level, discovered in _levels(graph, batch):
+            reached: int = 0
+            for mask in discovered.values():
+                reached |= mask
+            while reached:
+                lowest: int = reached & -reached
+                eccentricity[lowest.bit_length() - 1] = level
+                reached ^= lowest
+        result.extend(eccentricity)
+    return result
+
+
+# Testing Entrypoint
+# ------------------
+if __name__ == '__main__':
+    import random
+    import time
+    from traversal.bfs import graph, traverse
+    from generators import random_csr
+
+    assert distances(graph, [0, 3, 4]) == [traverse(graph, source).level for source in (0, 3, 4)]
+    assert eccentricities(graph, [0, 3, 4]) == [2, 1, 0]
+    assert distances(graph, [0, 3, 4], batch_size=2) == distances(graph, [0, 3, 4])
+
+    # Benchmark
+    # - many sources , same graph
+    csr = random_csr(20_000, 8, seed=5)
+    sources: List[Node] = random.Random(5).sample(range(len(csr)), 256)
+
+    started: float = time.perf_counter()
+    expected: List[List[int]] = [traverse(csr, source).level for source in sources]
+    one_by_one_seconds: float = time.perf_counter() - started
+
+    print(f"\n{'Multi-Source BFS':^64}")
+    print(f"{len(sources)} sources , {csr.edge_count:,} edges , one bfs per source : {one_by_one_seconds:.2f}s\n")
+    print("+", "-" * 60, "+")
+    print(f"| {'batch size':>10} | {'distances (s)':>14} | {'eccentricities (s)':>18} | {'speed-up':>8} |")
+    print("+", "-" * 60, "+")
+    for batch_size in (64, 256):
+        started = time.perf_counter()
+        matrix: List[List[int]] = distances(csr, sources, batch_size)
+        distances_seconds: float = time.perf_counter() - started
+        started = time.perf_counter()
+        eccentricity: List[int] = eccentricities(csr, sources, batch_size)
+        eccentricities_seconds: float = time.perf_counter() - started
+        assert matrix == expected
+        assert eccentricity == [max(row) for row in expected]
+        print(f"| {batch_size:>10} | {distances_seconds:>14.2f} | {eccentricities_seconds:>18.2f} | {one_by_one_seconds / eccentricities_seconds:>7.1f}x |")
+    print("+", "-" * 60, "+")
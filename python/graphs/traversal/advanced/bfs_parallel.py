@@ -0,0 +1,130 @@
+"""
+BFS ( Parallel , over Partitioned Graph )
+
+- a single core walks the levels one node at a time , so we split the nodes between worker processes
+- the graph ( CSR `offsets` & `targets` ) and the `level` array live in shared memory
+    - workers attach to them by name , nothing of the graph is pickled per task
+
+Partitioning :
+
+- nodes are split in contiguous blocks , worker `p` *owns* nodes `p * block .. (p + 1) * block - 1`
+- only the owner ever writes the level of a node , so workers never race on a write
+
+Level Step :
+
+1. every worker gets the batch of candidate nodes addressed to it ( it's inbox )
+2. it keeps the ones with no level yet , and gives them the current level
+3. it scans their neighbours and sorts the unvisited ones into outboxes , by owner
+4. outboxes are exchanged : outbox `q` of every worker => inbox of worker `q` for the next level
+
+python3 -m traversal.advanced.bfs_parallel
+"""
+from typing import *
+from array import array
+from multiprocessing import Pool, shared_memory
+
+from graph_representation import CSR, Types
+
+Node = Types.Node
+
+# - shared arrays , attached once per worker process ( see `_attach` )
+_shared: Dict[str, Any] = {}
+
+
+def _open_shared(name: str) -> shared_memory.SharedMemory:
+    """attaches to an existing block , without handing it over to this process's resource tracker"""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)   # python 3.13+
+    except TypeError:
+        return shared_memory.SharedMemory(name=name)
+
+
+def _attach(offsets_name: str, targets_name: str, level_name: str, node_count: int, edge_count: int, block: int) -> None:
+    """worker initializer"""
+    blocks = [_open_shared(name) for name in (offsets_name, targets_name, level_name)]
+    _shared['blocks'] = blocks # keeps them mapped for the life of the worker
+    _shared['offsets'] = blocks[0].buf[:(node_count + 1) * 8].cast('q')
+    _shared['targets'] = blocks[1].buf[:edge_count * 8].cast('q')
+    _shared['level'] = blocks[2].buf[:node_count * 8].cast('q')
+    _shared['block'] = block
+
+
+def _expand(inbox: array, depth: int, workers: int) -> Tuple[int, List[array]]:
+    """one level step of one worker ( steps 2. & 3. ) , returns count of newly visited nodes & outboxes"""
+    offsets, targets, level, block = _shared['offsets'], _shared['targets'], _shared['level'], _shared['block']
+    outboxes: List[set] = [set() for _ in range(workers)]
+    visited: int = 0
+    for node in set(inbox):
+        if level[node] >= 0:
+            continue
+        level[node] = depth                                                     # 2.
+        visited += 1
+        for position in range(offsets[node], offsets[node + 1]):               # 3.
+            neighbour: int = targets[position]
+            if level[neighbour] < 0:
+                outboxes[neighbour // block].add(neighbour)
+    return visited, [array('q', outbox) for outbox in outboxes]
+
+
+def _share(data: bytes) -> shared_memory.SharedMemory:
+    block: shared_memory.SharedMemory = shared_memory.SharedMemory(create=True, size=max(len(data), 1))
+    block.buf[:len(data)] = data
+    return block
+
+
+def traverse(csr: CSR, source: Node, workers: int = 4) -> List[int]:
+    """
+    hop count from `source` to every node ( `-1` if not reachable ) , same as `traversal.bfs.traverse(...).level`
+    """
+    node_count: int = len(csr)
+    if node_count == 0:
+        return []
+    block: int = -(-node_count // workers)  # ceil
+    offsets_block = _share(csr.offsets.tobytes())
+    targets_block = _share(csr.targets.tobytes())
+    level_block = _share((array('q', [-1]) * node_count).tobytes())
+    try:
+        initargs = (offsets_block.name, targets_block.name, level_block.name, node_count, csr.edge_count, block)
+        with Pool(workers, initializer=_attach, initargs=initargs) as pool:
+            inboxes: List[array] = [array('q') for _ in range(workers)]
+            inboxes[source // block].append(source)
+            depth: int = 0
+            while any(inboxes):
+                # 1. , 2. & 3. in parallel
+                results = pool.starmap(_expand, [(inbox, depth, workers) for inbox in inboxes])
+                # 4. exchange
+                inboxes = [array('q') for _ in range(workers)]
+                for _, outboxes in results:
+                    for owner, outbox in enumerate(outboxes):
+                        inboxes[owner].extend(outbox)
+                depth += 1
+        level_view = level_block.buf[:node_count * 8].cast('q')
+        levels: List[int] = level_view.tolist()
+        level_view.release()
+        return levels
+    finally:
+        for shared in (offsets_block, targets_block, level_block):
+            shared.close()
+            shared.unlink()
+
+
+# Testing Entrypoint
+# ------------------
+if __name__ == '__main__':
+    import time
+    from traversal.bfs import graph, traverse as serial_traverse
+    from generators import random_csr
+
+    assert traverse(CSR.from_adjacency(graph), 0, workers=2) == serial_traverse(graph, 0).level
+    assert traverse(CSR.from_adjacency({}), 0) == []
+
+    # - same levels as the serial bfs , on a fixed seed graph
+    csr: CSR = random_csr(500_000, 8, seed=2024)
+    started: float = time.perf_counter()
+    expected: List[int] = serial_traverse(csr, 0).level
+    serial_seconds: float = time.perf_counter() - started
+    print(f"\nserial   : {serial_seconds:.2f}s")
+    for workers in (2, 4):
+        started = time.perf_counter()
+        assert traverse(csr, 0, workers=workers) == expected
+        print(f"{workers} workers : {time.perf_counter() - started:.2f}s")
@@ -2,27 +2,44 @@
 BFS via AL ( Adjacency List )
 
 - we'll do graph traversal via Adjacency List 
+
+python3 -m traversal.advanced.bfs_via_AL
 """
-from graphs.graph_representation import Graph, Types
+from collections import deque
+from graph_representation import Graph, Types
 from typing import *
 
-def bfs(source: Types.Node):
+def bfs(graph: Graph, source: Types.Node) -> str:
     """
+    - reads `graph.adjacency_list` , one neighbour at a time
+    - `O(V + E)` , a node is marked as soon as it's queued
     """
+    _graph: Mapping[Types.Node, List[Types.Node]] = graph.adjacency_list
+
     # track the linear order of arrival of nodes in traversal
-    traversal_order_track: str = ''
+    traversal_order: List[Types.Node] = []
     
     # visited flag check
-    visited: set[Types.Node] = set()
+    visited: set[Types.Node] = {source}
     # visiting queue
-    to_visit: List[Types.Node] = [source]
+    to_visit: deque = deque([source])
     # 
     while to_visit:
-        node = to_visit.pop(0)
-        visited.add(node)
-        traversal_order_track += f"-> {node} "
-        neighbour_nodes = node.get_links()
-        for node in neighbour_nodes:
-            if node not in visited and node not in to_visit:
-                to_visit.append(node)
-    return traversal_order_track.strip('->').strip(' ')
+        node = to_visit.popleft()
+        traversal_order.append(node)
+        for neighbour in _graph[node]:
+            if neighbour not in visited:
+                visited.add(neighbour)
+                to_visit.append(neighbour)
+    return ' -> '.join(str(node) for node in traversal_order)
+
+if __name__ == '__main__':
+
+    graph: Graph = Graph()
+    for node in range(5):
+        graph.add_node(node)
+    for edge in [(0, 1), (0, 2), (1, 2), (1, 3), (2, 4), (3, 2), (3, 4)]:
+        graph.add_edge(edge)
+
+    assert bfs(graph, 0) == "0 -> 1 -> 2 -> 3 -> 4"
+    assert bfs(graph, 3) == "3 -> 2 -> 4"
@@ -1,5 +1,116 @@
 """
-BFS via AL ( Adjacency List )
+BFS via AM ( Adjacency Matrix )
 
-- we'll do graph traversal via Adjacency List 
+- we'll do graph traversal via Adjacency Matrix 
+- finding the neighbours of a node means scanning it's whole row , `O(V)` per node
+    - cell by cell in python , that's `V` loop steps per node
+    - so rows are packed into bits ( 8 cells per byte , `np.packbits` ) and scanned with numpy :
+        - `row & ~visited` gives the unvisited neighbours of a node , for the whole row at once
+
+python3 -m traversal.advanced.bfs_via_AM
 """
+from collections import deque
+from graph_representation import Graph, Types
+from typing import *
+import numpy as np
+
+def pack(graph: Graph, transpose: bool = False) -> np.ndarray:
+    """
+    packs `graph.adjacency_matrix` , row `i` => `ceil(V / 8)` bytes
+
+    - `transpose` : packs the columns instead , row `i` => the in-neighbours of `i`
+    - an empty graph packs to a `( 0 , 0 )` array
+    - a graph with nodes but no matrix rows ( built with `ADJACENCY_LIST` only ) can't be packed
+    """
+    row_count: int = len(graph.adjacency_matrix)
+    if row_count == 0:
+        if len(graph) > 0:
+            raise Exception(f'ERROR:NO-ADJACENCY-MATRIX - graph has {len(graph)} nodes but an empty adjacency matrix , add them with `ADJACENCY_MATRIX`')
+        return np.zeros((0, 0), dtype=np.uint8)
+    matrix: np.ndarray = np.array(list(graph.adjacency_matrix), dtype=bool).reshape(row_count, -1)
+    return np.packbits(matrix.T if transpose else matrix, axis=1)
+
+def bfs(graph: Graph, source: Types.Node, packed: Optional[np.ndarray] = None) -> str:
+    """
+    - reads `graph.adjacency_matrix` , a packed row at a time
+    - `packed` : result of `pack(graph)` , pass it in for repeated traversals of the same graph
+    - visiting order is same as the adjacency list traversal , when neighbours are added in increasing order
+    """
+    if packed is None:
+        packed = pack(graph)
+    node_count: int = packed.shape[0]
+
+    # track the linear order of arrival of nodes in traversal
+    traversal_order: List[Types.Node] = []
+
+    # visited flags , packed the same way as the rows
+    visited: np.ndarray = np.zeros(packed.shape[1], dtype=np.uint8)
+    visited[source >> 3] |= 0x80 >> (source & 7)
+    # visiting queue
+    to_visit: deque = deque([source])
+    #
+    while to_visit:
+        node = to_visit.popleft()
+        traversal_order.append(node)
+        fresh: np.ndarray = packed[node] & ~visited
+        if fresh.any():
+            visited |= fresh
+            to_visit.extend(np.flatnonzero(np.unpackbits(fresh, count=node_count)).tolist())
+    return ' -> '.join(str(node) for node in traversal_order)
+
+if __name__ == '__main__':
+    import random
+    import time
+    from traversal.advanced import bfs_via_AL
+    from graph_representation import RepresentationOption
+
+    graph: Graph = Graph()
+    for node in range(5):
+        graph.add_node(node)
+    for edge in [(0, 1), (0, 2), (1, 2), (1, 3), (2, 4), (3, 2), (3, 4)]:
+        graph.add_edge(edge)
+
+    assert bfs(graph, 0) == "0 -> 1 -> 2 -> 3 -> 4"
+    assert bfs(graph, 3) == "3 -> 2 -> 4"
+
+    # - empty graph , and a graph without matrix rows
+    assert pack(Graph()).shape == (0, 0)
+    list_only: Graph = Graph()
+    list_only.add_node(0, to_representation=RepresentationOption.ADJACENCY_LIST)
+    try:
+        pack(list_only)
+        packed_anyway: bool = True
+    except Exception as error:
+        packed_anyway = not str(error).startswith('ERROR:NO-ADJACENCY-MATRIX')
+    assert not packed_anyway
+
+    # Benchmark
+    # - adjacency list vs packed adjacency matrix , on sparse & dense graphs
+    print(f"\n{'BFS : Adjacency List vs Adjacency Matrix':^70}")
+    print("+", "-" * 66, "+")
+    print(f"| {'graph':<24} | {'edges':>9} | {'list (s)':>10} | {'matrix (s)':>10} |")
+    print("+", "-" * 66, "+")
+    rng: random.Random = random.Random(1)
+    node_count: int = 2000
+    for name, probability in (('sparse ( 4 per node )', 4 / node_count), ('dense ( 40% of pairs )', 0.4)):
+        graph = Graph()
+        for representation in (RepresentationOption.ADJACENCY_LIST, RepresentationOption.ADJACENCY_MATRIX):
+            for node in range(node_count):
+                graph.add_node(node, to_representation=representation)
+        edge_count: int = 0
+        for _from in range(node_count):
+            for _to in sorted(rng.sample(range(node_count), int(probability * node_count))):
+                graph.add_edge((_from, _to), to_representation=RepresentationOption.ADJACENCY_LIST)
+                graph.add_edge((_from, _to), to_representation=RepresentationOption.ADJACENCY_MATRIX)
+                edge_count += 1
+        packed: np.ndarray = pack(graph)
+
+        started: float = time.perf_counter()
+        list_order: str = bfs_via_AL.bfs(graph, 0)
+        list_seconds: float = time.perf_counter() - started
+        started = time.perf_counter()
+        matrix_order: str = bfs(graph, 0, packed)
+        matrix_seconds: float = time.perf_counter() - started
+        assert list_order == matrix_order
+        print(f"| {name:<24} | {edge_count:>9,} | {list_seconds:>10.4f} | {matrix_seconds:>10.4f} |")
+    print("+", "-" * 66, "+")
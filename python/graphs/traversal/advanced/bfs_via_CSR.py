@@ -0,0 +1,85 @@
+"""
+BFS via CSR ( Level Synchronous , Vectorized )
+
+- we'll do graph traversal a whole frontier at a time , over the CSR arrays
+- `traversal.bfs.traverse` handles one neighbour per loop step , here each level is a handful of numpy calls :
+    1. gather   : neighbours of every frontier node in one go ( `offsets` => positions in `targets` )
+    2. mask     : keep the ones with no distance yet
+    3. unique   : drop the duplicates ( two frontier nodes sharing a neighbour )
+    4. the survivors get distance `level + 1` , and become the next frontier
+
+- order of visiting inside a level is not tracked ( only the distances are )
+
+python3 -m traversal.advanced.bfs_via_CSR
+"""
+from typing import *
+import numpy as np
+
+from graph_representation import CSR, Types
+
+
+def csr_arrays(csr: CSR) -> Tuple[np.ndarray, np.ndarray]:
+    """`offsets` & `targets` of a CSR as numpy arrays ( no copy )"""
+    return np.frombuffer(csr.offsets, dtype=np.int64), np.frombuffer(csr.targets, dtype=np.int64)
+
+
+def gather_neighbours(offsets: np.ndarray, targets: np.ndarray, frontier: np.ndarray) -> np.ndarray:
+    """neighbours of all the frontier nodes , back to back ( duplicates included )"""
+    starts: np.ndarray = offsets[frontier]
+    counts: np.ndarray = offsets[frontier + 1] - starts
+    total: int = int(counts.sum())
+    if total == 0:
+        return targets[:0]
+    # - position in `targets` of the k-th gathered neighbour :
+    #       start of it's frontier node + how far into that node's list it is
+    list_begins: np.ndarray = np.cumsum(counts) - counts
+    positions: np.ndarray = np.repeat(starts - list_begins, counts) + np.arange(total)
+    return targets[positions]
+
+
+def distances(csr: CSR, source: Types.Node) -> np.ndarray:
+    """
+    hop count from `source` to every node ( `-1` if not reachable )
+    """
+    offsets, targets = csr_arrays(csr)
+    distance: np.ndarray = np.full(len(csr), -1, dtype=np.int64)
+    distance[source] = 0
+    frontier: np.ndarray = np.array([source], dtype=np.int64)
+    level: int = 0
+    while frontier.size:
+        neighbours: np.ndarray = gather_neighbours(offsets, targets, frontier)     # 1.
+        neighbours = neighbours[distance[neighbours] < 0]                           # 2.
+        frontier = np.unique(neighbours)                                            # 3.
+        level += 1
+        distance[frontier] = level                                                  # 4.
+    return distance
+
+
+# Testing Entrypoint
+# ------------------
+if __name__ == '__main__':
+    import time
+    from traversal.bfs import graph, traverse
+    from generators import random_csr
+
+    csr: CSR = CSR.from_adjacency(graph)
+    assert distances(csr, 0).tolist() == traverse(graph, 0).level == [0, 1, 1, 2, 2]
+    assert distances(csr, 3).tolist() == [-1, -1, 1, 0, 1]
+
+    # Benchmark
+    # - edges/second over a whole BFS ( every edge of the reachable part is read once )
+    print(f"\n{'Vectorized vs Per-Node BFS':^76}")
+    print("+", "-" * 72, "+")
+    print(f"| {'nodes':>10} | {'edges':>11} | {'per-node edges/s':>18} | {'vectorized edges/s':>20} |")
+    print("+", "-" * 72, "+")
+    for node_count, average_degree in ((100_000, 8), (1_000_000, 8)):
+        csr = random_csr(node_count, average_degree, seed=42)
+        started: float = time.perf_counter()
+        expected: List[int] = traverse(csr, 0).level
+        loop_seconds: float = time.perf_counter() - started
+        started = time.perf_counter()
+        result: np.ndarray = distances(csr, 0)
+        vectorized_seconds: float = time.perf_counter() - started
+        assert result.tolist() == expected
+        print(f"| {node_count:>10,} | {csr.edge_count:>11,} | {csr.edge_count / loop_seconds:>18,.0f} | {csr.edge_count / vectorized_seconds:>20,.0f} |")
+    print("+", "-" * 72, "+")
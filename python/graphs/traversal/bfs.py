@@ -6,13 +6,16 @@ BFS ( Breadth First Search )
 
 """
 from typing import *
+from collections import deque
+from graph_representation import AdjacencyView, CSR
 
 # Custom Types
 
 # - a node ( vertex ) type
 Node = NewType('Node', int)
 # - a graph type
-Graph = NewType('Graph', Dict[Node, Set]) # Adjacency List
+#       - any representation following the neighbour access protocol ( dict / `Graph` / `CSR` )
+Graph = AdjacencyView[Node] # Adjacency List
 
 # Reresentation of graph that we'll use for demonstration
 GRAPH_REPRESENTATION = """
@@ -64,47 +67,104 @@ graph: Graph = {
 }
 
 
-def bfs(graph: Graph, source: Node):
+# - a BFS result
+class BFSResult(NamedTuple):
     """
-    BFS Traversing Alogo
+    - `order`        : nodes in the order they were visited
+    - `level[node]`  : hop count from source ( `-1` if not reachable )
+    - `parent[node]` : node it was discovered from ( `-1` for source & not reachable nodes )
 
     - Note
-        - using adjacency list representation
-        - bfs traversal order differ for different source
+        - `level` & `parent` are lists indexed by node , when nodes are named `0 .. n-1` ,
+            dicts keyed by node otherwise ( `level[node]` reads the same either way )
+    """
+    order: List[Node]
+    level: Union[List[int], Dict[Node, int]]
+    parent: Union[List[int], Dict[Node, Node]]
+
+
+def _is_dense(graph: Graph) -> bool:
+    """checks if the nodes are named `0 .. n-1` , so per-node state can live in plain lists"""
+    if isinstance(graph, CSR):
+        return True
+    node_count: int = len(graph)
+    return all(type(node) is int and 0 <= node < node_count for node in graph)
+
+
+def traverse(graph: Graph, source: Node) -> BFSResult:
     """
-    # Steps
-    # -----
+    BFS Engine
+    ----------
+    - runs in `O(V + E)`
+        - a `deque` gives `O(1)` pops from the front ( `list.pop(0)` shifts the whole list )
+        - a node is marked as soon as it is queued , so it can never be queued twice
+            ( no need to search the queue , like `node not in to_visit` )
 
+    - Note
+        - nodes named `0 .. n-1` ( & `CSR` ) : per-node results are plain lists indexed by node
+        - any other hashable node names ( `10 , 20` / `'a' , 'b'` ... ) : dicts keyed by node
+    """
     # Prepration
 
-    # - variable to track the linear order of arrival of nodes in traversal
-    traversal_order_track: str = ''
-    # - storage for already visited nodes
-    #       - visited flag check
-    visited: set[Node] = set()
+    # - `level` doubles as the visited flag ( `-1` : not visited yet )
+    if _is_dense(graph):
+        level: Union[List[int], Dict[Node, int]] = [-1] * len(graph)
+        parent: Union[List[int], Dict[Node, Node]] = [-1] * len(graph)
+    else:
+        level = dict.fromkeys(graph, -1)
+        parent = dict.fromkeys(graph, -1)
+    order: List[Node] = []
     # - visiting queue
-    #       - it determines which node to visit next
-    to_visit: List[Node] = [source]
-    
-    # Starting point
+    to_visit: deque = deque([source])
+    level[source] = 0
 
-    # - idefinate loop until all nodes are visited
+    # Starting point
     while to_visit:
         # 1. visit a node
-        # 2. mark it as visited
-        # 3. add it to your traversal tracking
-        # 4. fetch all neighbour nodes
-        # 5. add the neighbours to the queue for visiting
-        #       - only if a node is neither visited & not to be visited in queue
-        node: Node = to_visit.pop(0)                            # 1.
-        visited.add(node)                                       # 2.
-        traversal_order_track += f"-> {node} "                  # 3.
-        neighbour_nodes: List[Node] = graph[node]               # 4.
-        for node in neighbour_nodes:                            # 5.
-            if node not in visited and node not in to_visit:    # 5.1
-                to_visit.append(node)
-    # return results
-    return traversal_order_track.strip('->').strip(' ')
+        # 2. add it to the traversal order
+        # 3. queue the neighbours not visited yet , marking them visited right away
+        node: Node = to_visit.popleft()                         # 1.
+        order.append(node)                                      # 2.
+        next_level: int = level[node] + 1
+        for neighbour in graph[node]:                           # 3.
+            if level[neighbour] < 0:
+                level[neighbour] = next_level
+                parent[neighbour] = node
+                to_visit.append(neighbour)
+    return BFSResult(order, level, parent)
+
+
+def traverse_lazily(graph: Graph, source: Node) -> Iterator[Tuple[Node, int, int]]:
+    """
+    Lazy BFS Engine
+    ---------------
+    - same as `traverse` , but yields `( node, level, parent )` as each node is visited
+        - nothing is accumulated , only a visited bitmap ( 1 byte per node ) and the queue are held
+            ( a dict of flags , when nodes are not named `0 .. n-1` )
+        - stop consuming at any point , and the rest of the graph is never explored
+    """
+    visited: Union[bytearray, Dict[Node, int]] = bytearray(len(graph)) if _is_dense(graph) else dict.fromkeys(graph, 0)
+    visited[source] = 1
+    to_visit: deque = deque([(source, 0, -1)])
+    while to_visit:
+        node, level, parent = to_visit.popleft()
+        yield node, level, parent
+        for neighbour in graph[node]:
+            if not visited[neighbour]:
+                visited[neighbour] = 1
+                to_visit.append((neighbour, level + 1, node))
+
+
+def bfs(graph: Graph, source: Node):
+    """
+    BFS Traversing Alogo
+
+    - Note
+        - using adjacency list representation
+        - bfs traversal order differ for different source
+        - formats the visiting order of `traverse` , use `traverse` for structured results
+    """
+    return ' -> '.join(str(node) for node in traverse(graph, source).order)
 
 # Testing Entrypoint
 # ------------------
@@ -114,3 +174,32 @@ if __name__ == '__main__':
     print(bfs_traversal_order)
     expected_order = "0 -> 1 -> 2 -> 3 -> 4"
     assert bfs_traversal_order == expected_order
+
+    # - same traversal , straight over other representations ( no conversion )
+    csr: CSR = CSR.from_adjacency(graph)
+    assert bfs(csr, Node(0)) == expected_order
+
+    # - structured results
+    result: BFSResult = traverse(graph, Node(0))
+    assert result.order == [0, 1, 2, 3, 4]
+    assert result.level == [0, 1, 1, 2, 2]
+    assert result.parent == [-1, 0, 0, 1, 2]
+    assert list(traverse_lazily(graph, Node(0))) == list(zip(result.order, [0, 1, 1, 2, 2], [-1, 0, 0, 1, 2]))
+    assert traverse(graph, Node(3)).level == [-1, -1, 1, 0, 1]
+
+    # - nodes not named `0 .. n-1` ( non-contiguous / strings ) , per-node results keyed by node
+    assert bfs({10: {20}, 20: set()}, 10) == "10 -> 20"
+    sparse_result: BFSResult = traverse({10: [30, 20], 20: [], 30: [20], 40: []}, 10)
+    assert sparse_result.level == {10: 0, 30: 1, 20: 1, 40: -1} and sparse_result.parent[20] == 10
+    assert bfs({'a': ['b', 'c'], 'b': ['c'], 'c': []}, 'a') == "a -> b -> c"
+    assert [node for node, _, _ in traverse_lazily({'a': ['b'], 'b': ['a']}, 'b')] == ['b', 'a']
+
+    # - linear time on a million node graph ( a chain + a skip edge per node )
+    import time
+    node_count: int = 1_000_000
+    big_graph: CSR = CSR.from_adjacency({node: [(node + 1) % node_count, (node * 7 + 3) % node_count] for node in range(node_count)})
+    started: float = time.perf_counter()
+    result = traverse(big_graph, Node(0))
+    seconds: float = time.perf_counter() - started
+    assert len(result.order) == node_count
+    print(f"{node_count:,} nodes , {big_graph.edge_count:,} edges : {seconds:.2f}s ( {big_graph.edge_count / seconds:,.0f} edges/s )")
@@ -2,9 +2,10 @@
 DFS ( Depth First Search )
 """
 from typing import *
+from graph_representation import AdjacencyView, CSR
 
 Node = NewType('Node', int)
-Graph = NewType('Graph', Dict[Node, Set]) # Adjacency List
+Graph = AdjacencyView[Node] # Adjacency List ( dict / `Graph` / `CSR` )
 
 GRAPH_REPRESENTATION = """
 
@@ -59,26 +60,138 @@ def dfs(graph: Graph, source: Node):
     """
     - using adjacency list representation
     - dfs traversal order differ for different source
+    - a node is visited when popped , so this order is not a proper pre-order ,
+        use `traverse` for discovery / finish times
     """
     # track the linear order of arrival of nodes in traversal
-    traversal_order_track: str = ''
+    traversal_order: List[str] = []
     
     # visited flag check
     visited: set[Node] = set()
-    # visiting queue
+    # visiting stack
     to_visit: List[Node] = [source]
+    # nodes currently in the stack ( saves searching the stack )
+    in_stack: set[Node] = {source}
     # 
     while to_visit:
         node = to_visit.pop()
+        in_stack.discard(node)
         visited.add(node)
-        traversal_order_track += f"-> {node} "
+        traversal_order.append(str(node))
         neighbour_nodes = graph[node]
         
         for node in reversed(list(neighbour_nodes)): # `reversed` function ensures that we get the latest made neighbour first
             
-            if node not in visited and node not in to_visit:
+            if node not in visited and node not in in_stack:
                 to_visit.append(node)
-    return traversal_order_track.strip('->').strip(' ')
+                in_stack.add(node)
+    return ' -> '.join(traversal_order)
+
+
+# Edge Types ( for a directed graph )
+# - TREE    : leads to an undiscovered node
+# - BACK    : leads to an ancestor , still open on the stack ( => a cycle )
+# - FORWARD : leads to an already finished descendant
+# - CROSS   : leads to an already finished node in another branch / tree
+TREE = "TREE"
+BACK = "BACK"
+FORWARD = "FORWARD"
+CROSS = "CROSS"
+
+
+class DFSResult(NamedTuple):
+    """
+    - `discovery[node]` / `finish[node]` : times the node was opened / closed ( `-1` if not reached )
+    - `parent[node]`    : node it was discovered from ( `-1` for roots & not reached nodes )
+    - `preorder`        : nodes by discovery time
+    - `postorder`       : nodes by finish time ( reversed , it's a topological order for a DAG )
+    """
+    discovery: List[int]
+    finish: List[int]
+    parent: List[int]
+    preorder: List[Node]
+    postorder: List[Node]
+
+
+def traverse(
+    graph: Graph,
+    sources: Optional[Union[Node, Iterable[Node]]] = None,
+    on_discover: Optional[Callable[[Node, int], Optional[bool]]] = None,
+    on_finish: Optional[Callable[[Node, int], Optional[bool]]] = None,
+    on_edge: Optional[Callable[[Node, Node, str], Optional[bool]]] = None,
+) -> DFSResult:
+    """
+    DFS Engine
+    ----------
+    - iterative ( no recursion limit ) and `O(V + E)`
+        - the stack holds `( node, iterator over it's neighbours )` , so a node stays open
+            until all it's neighbours are done , which is what gives proper finish times
+    - `sources` : a node , or nodes to start from in order ( default : every node , i.e the whole forest )
+    - callbacks
+        - `on_discover(node, time)` , `on_finish(node, time)` , `on_edge(node, neighbour, edge_type)`
+        - a callback returning `True` stops the traversal right away ( e.g on the first `BACK` edge )
+
+    - Note
+        - nodes must be named `0 .. n-1`
+        - edge types are for directed graphs , in an un-directed graph every tree edge
+            is also seen back from the child as a `BACK` edge to it's parent
+    """
+    node_count: int = len(graph)
+    discovery: List[int] = [-1] * node_count
+    finish: List[int] = [-1] * node_count
+    parent: List[int] = [-1] * node_count
+    preorder: List[Node] = []
+    postorder: List[Node] = []
+    result: DFSResult = DFSResult(discovery, finish, parent, preorder, postorder)
+    clock: int = 0
+
+    if sources is None:
+        sources = range(node_count)
+    elif isinstance(sources, int):
+        sources = (sources,)
+
+    for root in sources:
+        if discovery[root] >= 0:
+            continue
+        discovery[root] = clock
+        preorder.append(root)
+        if on_discover and on_discover(root, clock):
+            return result
+        clock += 1
+        stack: List[Tuple[Node, Iterator[Node]]] = [(root, iter(graph[root]))]
+        while stack:
+            node, neighbours = stack[-1]
+            for neighbour in neighbours:
+                if discovery[neighbour] < 0:
+                    # - go deeper , `node` stays open with it's iterator where it was left
+                    if on_edge and on_edge(node, neighbour, TREE):
+                        return result
+                    parent[neighbour] = node
+                    discovery[neighbour] = clock
+                    preorder.append(neighbour)
+                    if on_discover and on_discover(neighbour, clock):
+                        return result
+                    clock += 1
+                    stack.append((neighbour, iter(graph[neighbour])))
+                    break
+                if on_edge:
+                    if finish[neighbour] < 0:
+                        edge_type: str = BACK
+                    elif discovery[node] < discovery[neighbour]:
+                        edge_type = FORWARD
+                    else:
+                        edge_type = CROSS
+                    if on_edge(node, neighbour, edge_type):
+                        return result
+            else:
+                # - all neighbours done , close the node
+                stack.pop()
+                finish[node] = clock
+                postorder.append(node)
+                if on_finish and on_finish(node, clock):
+                    return result
+                clock += 1
+    return result
 
 # entrypoint
 if __name__ == '__main__':
@@ -87,3 +200,26 @@ if __name__ == '__main__':
     print(bfs_traversal_order)
     expected_order = "0 -> 1 -> 3 -> 4 -> 2"
     assert bfs_traversal_order == expected_order
+
+    # - discovery / finish times & edge types
+    edges: List[Tuple[Node, Node, str]] = []
+    result: DFSResult = traverse({0: [1, 2], 1: [2, 3], 2: [4], 3: [2, 4], 4: []}, Node(0), on_edge=lambda *edge: edges.append(edge))
+    assert result.preorder == [0, 1, 2, 4, 3]
+    assert result.postorder == [4, 2, 3, 1, 0]
+    assert result.discovery == [0, 1, 2, 6, 3]
+    assert result.finish == [9, 8, 5, 7, 4]
+    assert result.parent == [-1, 0, 1, 1, 2]
+    assert edges == [(0, 1, TREE), (1, 2, TREE), (2, 4, TREE), (1, 3, TREE), (3, 2, CROSS), (3, 4, CROSS), (0, 2, FORWARD)]
+
+    # - stops on the first back edge
+    back_edges: List[Tuple[Node, Node]] = []
+    def stop_on_back_edge(node: Node, neighbour: Node, edge_type: str) -> bool:
+        if edge_type == BACK:
+            back_edges.append((node, neighbour))
+            return True
+    traverse({0: [1], 1: [2], 2: [0, 1]}, on_edge=stop_on_back_edge)
+    assert back_edges == [(2, 0)]
+
+    # - no recursion limit
+    chain: CSR = CSR.from_adjacency({node: [node + 1] for node in range(99_999)} | {99_999: []})
+    assert traverse(chain).postorder[0] == 99_999